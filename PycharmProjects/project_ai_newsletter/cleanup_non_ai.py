@@ -27,6 +27,7 @@ load_dotenv()
 from src.config import set_config, get_data_dir
 from src.database import ArticleDatabase
 from src.tracking import CostTracker, track_llm_cost, debug_log, setup_debug_logging
+from src.utils.json_parse import parse_json_response
 
 
 BATCH_SIZE = 25
@@ -309,7 +310,7 @@ def _verify_ai_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool
 
     # Parse response
     try:
-        result = _parse_llm_response(response_text)
+        result = parse_json_response(response_text)
 
         classifications = {}
         for item in result.get("classifications", []):
@@ -327,20 +328,6 @@ def _verify_ai_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool
         return False, {}
 
 
-def _parse_llm_response(response_text: str) -> dict:
-    """Parse LLM response, handling markdown code blocks."""
-    clean_text = response_text.strip()
-
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
-
-    return json.loads(clean_text)
-
-
 def _export_all_articles(config_name: str):
     """Export all remaining articles to JSON/CSV."""
     set_config(config_name)
@@ -16,6 +16,7 @@ First Run Behavior:
 
 from typing import TypedDict
 
+import numpy as np
 from langgraph.graph import StateGraph, START, END
 
 from src.config import set_config, DEFAULT_CONFIG
@@ -52,6 +53,7 @@ class DeduplicationState(TypedDict):
 
     # From load_historical_embeddings
     historical_articles: list[dict]
+    historical_embeddings: np.ndarray  # row i embeds historical_articles[i]
     is_first_run: bool
 
     # From compare_similarities
@@ -158,6 +160,7 @@ def run(
         "merge_stats": {},
         "articles_with_embeddings": [],
         "historical_articles": [],
+        "historical_embeddings": None,
         "is_first_run": False,
         "unique_articles": [],
         "duplicate_articles": [],
@@ -11,6 +11,7 @@ Regenerates using the same LLM with stronger prompts and validation.
 import argparse
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from src.database import ArticleDatabase
 from src.functions.generate_summaries import (
     _validate_summary,
     _retry_single_article,
+    MAX_CONCURRENT_BATCHES,
     MAX_SUMMARY_LENGTH,
 )
 from src.tracking import CostTracker, debug_log, setup_debug_logging
@@ -70,27 +72,34 @@ def regenerate_bad_summaries(config_name: str, dry_run: bool = False) -> dict:
             print(f"  - [{reason}] {title}... ({summary_len} chars)")
         return {"total": len(bad_articles), "fixed": 0, "failed": 0, "dry_run": True}
 
-    # Regenerate each article
+    # Convert DB article format to pipeline format
+    retry_inputs = [
+        (
+            {
+                "link": article.get("url", ""),
+                "title": article.get("title", ""),
+                "full_content": article.get("full_content", ""),
+                "description": article.get("summary", ""),  # Use existing as fallback
+            },
+            article.get("regenerate_reason", "unknown"),
+        )
+        for article in bad_articles
+    ]
+
+    # Retry with validation - independent blocking LLM calls, so run them on threads
+    debug_log(f"[REGEN] Regenerating {len(retry_inputs)} summaries ({MAX_CONCURRENT_BATCHES} at a time)")
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as executor:
+        retry_results = list(executor.map(lambda item: _retry_single_article(*item), retry_inputs))
+
+    # Apply results (DB writes stay on the main thread)
     fixed_count = 0
     failed_count = 0
 
-    for i, article in enumerate(bad_articles, 1):
+    for i, (article, (new_summary, new_title)) in enumerate(zip(bad_articles, retry_results), 1):
         title = article.get("title", "")[:40]
         url = article.get("url", "")
-        reason = article.get("regenerate_reason", "unknown")
-
-        debug_log(f"[REGEN] Processing {i}/{len(bad_articles)}: {title}...")
-
-        # Convert DB article format to pipeline format
-        pipeline_article = {
-            "link": url,
-            "title": article.get("title", ""),
-            "full_content": article.get("full_content", ""),
-            "description": article.get("summary", ""),  # Use existing as fallback
-        }
 
-        # Retry with validation
-        new_summary, new_title = _retry_single_article(pipeline_article, reason)
+        debug_log(f"[REGEN] Result {i}/{len(bad_articles)}: {title}...")
 
         if new_summary:
             # Update database
@@ -29,6 +29,12 @@ DEFAULT_CONFIG = "business_news"
 # Current active configuration (module-level state)
 _current_config: str = DEFAULT_CONFIG
 
+# Data directories already created this process (skip repeated mkdir)
+_created_dirs: set[Path] = set()
+
+# Parsed config files, keyed by path: ((mtime_ns, size), data)
+_config_json_cache: dict[Path, tuple[tuple[int, int], object]] = {}
+
 
 def set_config(config_name: str) -> None:
     """
@@ -81,9 +87,26 @@ def get_data_dir() -> Path:
     Returns:
         Path to data/{config_name}/ directory
     """
-    data_dir = DATA_DIR / _current_config
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    return _ensure_dir(DATA_DIR / _current_config)
+
+
+def _ensure_dir(path: Path) -> Path:
+    """
+    Create a directory once per process.
+
+    get_data_dir() is called by most nodes (several times per run); the
+    path still follows the active config, only the mkdir is skipped.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path
+    """
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+    return path
 
 
 def load_config_settings() -> dict:
@@ -95,10 +118,35 @@ def load_config_settings() -> dict:
     """
     config_file = get_config_path() / "config.json"
     if config_file.exists():
-        return json.loads(config_file.read_text(encoding="utf-8"))
+        return read_config_json(config_file)
     return {}
 
 
+def read_config_json(path: Path):
+    """
+    Read a JSON file from a config directory, parsing it only when it changes.
+
+    Config files are read by several nodes per run (and again per config in
+    multi-config runs); the parsed result is reused until the file's
+    mtime or size changes. The returned data is shared - treat it as read-only.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _config_json_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, json.loads(path.read_bytes()))
+        _config_json_cache[path] = cached
+
+    return cached[1]
+
+
 # =============================================================================
 # Shared Data Directory (for multi-config Twitter caching)
 # =============================================================================
@@ -113,9 +161,7 @@ def get_shared_data_dir() -> Path:
     Returns:
         Path to data/shared/ directory (creates if needed)
     """
-    shared_dir = DATA_DIR / "shared"
-    shared_dir.mkdir(parents=True, exist_ok=True)
-    return shared_dir
+    return _ensure_dir(DATA_DIR / "shared")
 
 
 def get_shared_twitter_cache_path() -> Path:
@@ -280,6 +280,13 @@ class ArticleDatabase:
     # Article Storage
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _embedding_to_blob(embedding: Optional[np.ndarray]) -> Optional[bytes]:
+        """Serialize an embedding as float32 bytes (the on-disk format)."""
+        if embedding is None:
+            return None
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
     def insert_article(
         self,
         article: dict,
@@ -299,7 +306,7 @@ class ArticleDatabase:
         url = article.get("url", article.get("link", ""))
         url_hash = self._hash_url(url)
 
-        embedding_blob = embedding.tobytes() if embedding is not None else None
+        embedding_blob = self._embedding_to_blob(embedding)
 
         try:
             with self._connection() as conn:
@@ -353,7 +360,7 @@ class ArticleDatabase:
             for article, embedding in zip(articles, embeddings):
                 url = article.get("url", article.get("link", ""))
                 url_hash = self._hash_url(url)
-                embedding_blob = embedding.tobytes() if embedding is not None else None
+                embedding_blob = self._embedding_to_blob(embedding)
 
                 try:
                     conn.execute(
@@ -562,7 +569,8 @@ class ArticleDatabase:
     def get_recent_articles(
         self,
         hours: int = 48,
-        with_embeddings: bool = True
+        with_embeddings: bool = True,
+        require_embedding: bool = False
     ) -> list[dict]:
         """
         Get articles from the last N hours.
@@ -570,22 +578,23 @@ class ArticleDatabase:
         Args:
             hours: Number of hours to look back (default: 48).
             with_embeddings: Whether to include embeddings (default: True).
+            require_embedding: Only return articles that have an embedding
+                (filtered in SQL, so other rows are never read).
 
         Returns:
             List of article dicts with embeddings if requested.
         """
         cutoff = (datetime.now() - timedelta(hours=hours)).strftime("%Y-%m-%d")
 
+        query = "SELECT * FROM articles WHERE pub_date >= ?"
+        if require_embedding:
+            query += " AND embedding IS NOT NULL"
+        query += " ORDER BY pub_date DESC"
+
         with self._connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM articles WHERE pub_date >= ? ORDER BY pub_date DESC",
-                (cutoff,)
-            ).fetchall()
+            rows = conn.execute(query, (cutoff,)).fetchall()
 
-            articles = []
-            for row in rows:
-                article = self._row_to_dict(row, with_embeddings)
-                articles.append(article)
+            articles = [self._row_to_dict(row, with_embeddings) for row in rows]
 
             debug_log(f"[DB] Retrieved {len(articles)} articles from last {hours}h")
             return articles
@@ -10,12 +10,13 @@ import json
 from typing import TypedDict
 
 from dotenv import load_dotenv
-import anthropic
 
 # Load environment variables
 load_dotenv()
 
 from src.utils import load_prompt
+from src.utils.llm_clients import get_anthropic_client
+from src.utils.json_parse import parse_json_response
 from src.tracking import track_llm_cost, debug_log, track_time
 from src.functions.fetch_source_reputation import SourceReputation
 
@@ -110,13 +111,13 @@ def _assess_batch(sources: list[SourceReputation]) -> list[CredibilityAssessment
         for s in sources
     ]
 
-    user_message = json.dumps({"sources": sources_for_llm}, indent=2)
+    user_message = json.dumps({"sources": sources_for_llm}, ensure_ascii=False, separators=(",", ":"))
 
     debug_log(f"[LLM INPUT]: System prompt length: {len(system_prompt)}, batch_size: {len(sources)}")
     debug_log(f"[LLM INPUT USER]: {user_message[:2000]}...")
 
     # Make LLM call
-    client = anthropic.Anthropic()
+    client = get_anthropic_client()
 
     response = client.messages.create(
         model="claude-haiku-4-5-20251001",
@@ -140,7 +141,7 @@ def _assess_batch(sources: list[SourceReputation]) -> list[CredibilityAssessment
 
     # Parse JSON response
     try:
-        result = _parse_llm_response(response_text)
+        result = parse_json_response(response_text)
 
         assessments: list[CredibilityAssessment] = []
         for item in result.get("assessments", []):
@@ -180,26 +181,3 @@ def _assess_batch(sources: list[SourceReputation]) -> list[CredibilityAssessment
             }
             for s in sources
         ]
-
-
-def _parse_llm_response(response_text: str) -> dict:
-    """
-    Parse LLM response, handling markdown code blocks.
-
-    Args:
-        response_text: Raw LLM response
-
-    Returns:
-        Parsed JSON dict
-    """
-    clean_text = response_text.strip()
-
-    # Remove markdown code blocks if present
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]  # Remove first line with ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
-
-    return json.loads(clean_text)
@@ -9,12 +9,12 @@ from datetime import datetime, timedelta
 from typing import TypedDict
 
 from dotenv import load_dotenv
-import anthropic
 
 # Load environment variables
 load_dotenv()
 
 from src.utils import load_prompt
+from src.utils.llm_clients import get_anthropic_client
 from src.tracking import track_llm_cost, debug_log, track_time
 
 
@@ -47,13 +47,13 @@ def classify_feeds(feed_titles: dict[str, list[str]]) -> dict[str, bool]:
         system_prompt = load_prompt("classify_feeds_system_prompt.md")
 
         # Prepare user message with feed titles
-        user_message = json.dumps(feed_titles, indent=2)
+        user_message = json.dumps(feed_titles, ensure_ascii=False, separators=(",", ":"))
 
         debug_log(f"[LLM INPUT]: {system_prompt}")
         debug_log(f"[LLM INPUT USER]: {user_message}")
 
         # Make LLM call
-        client = anthropic.Anthropic()
+        client = get_anthropic_client()
 
         response = client.messages.create(
             model="claude-sonnet-4-20250514",
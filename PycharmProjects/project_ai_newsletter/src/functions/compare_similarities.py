@@ -33,6 +33,7 @@ def compare_similarities(state: dict) -> dict:
         state: Pipeline state with:
             - 'articles_with_embeddings': New articles with embeddings
             - 'historical_articles': Historical articles from DB
+            - 'historical_embeddings': Embedding matrix, row i for historical_articles[i]
             - 'is_first_run': True if no historical data
 
     Returns:
@@ -46,6 +47,7 @@ def compare_similarities(state: dict) -> dict:
 
         new_articles = state.get("articles_with_embeddings", [])
         historical = state.get("historical_articles", [])
+        hist_embeddings = state.get("historical_embeddings")
         is_first_run = state.get("is_first_run", False)
 
         debug_log(
@@ -62,26 +64,25 @@ def compare_similarities(state: dict) -> dict:
                 "ambiguous_pairs": []
             }
 
-        # Build embedding matrices
-        new_embeddings = np.array([a["embedding"] for a in new_articles])
-        hist_embeddings = np.array([a["embedding"] for a in historical])
+        # Build new embedding matrix (historical arrives pre-stacked as float32)
+        # (new embeddings may be float16; upcast to the same dtype)
+        new_embeddings = np.array([a["embedding"] for a in new_articles], dtype=np.float32)
 
         debug_log(
             f"[NODE: compare_similarities] Computing {len(new_articles)} x {len(historical)} similarities"
         )
 
-        # Compute all pairwise similarities
+        # Compute all pairwise similarities, then each article's best match at once
         similarities = cosine_similarity(new_embeddings, hist_embeddings)
+        best_indices = similarities.argmax(axis=1)
+        best_sims = similarities[np.arange(len(new_articles)), best_indices]
 
         # Classify each new article
         unique = []
         duplicates = []
         ambiguous = []
 
-        for i, article in enumerate(new_articles):
-            max_sim = float(similarities[i].max())
-            max_idx = int(similarities[i].argmax())
-
+        for article, max_idx, max_sim in zip(new_articles, best_indices.tolist(), best_sims.tolist()):
             if max_sim < THRESHOLD_UNIQUE:
                 # Definitely unique
                 unique.append(article)
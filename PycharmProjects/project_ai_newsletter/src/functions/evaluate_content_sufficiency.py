@@ -10,12 +10,13 @@ import random
 from typing import TypedDict
 
 from dotenv import load_dotenv
-import anthropic
 
 # Load environment variables
 load_dotenv()
 
 from src.utils import load_prompt
+from src.utils.llm_clients import get_anthropic_client
+from src.utils.json_parse import parse_json_response
 from src.tracking import track_llm_cost, debug_log, track_time
 
 
@@ -160,13 +161,13 @@ def _evaluate_samples(samples: list[dict]) -> SufficiencyResult:
         for s in samples
     ]
 
-    user_message = json.dumps({"samples": samples_for_llm}, indent=2)
+    user_message = json.dumps({"samples": samples_for_llm}, ensure_ascii=False, separators=(",", ":"))
 
     debug_log(f"[LLM INPUT]: System prompt length: {len(system_prompt)}")
     debug_log(f"[LLM INPUT USER]: Evaluating {len(samples)} samples")
 
     # Make LLM call
-    client = anthropic.Anthropic()
+    client = get_anthropic_client()
 
     response = client.messages.create(
         model="claude-haiku-4-5-20251001",
@@ -189,7 +190,7 @@ def _evaluate_samples(samples: list[dict]) -> SufficiencyResult:
 
     # Parse response
     try:
-        result = _parse_llm_response(response_text)
+        result = parse_json_response(response_text)
 
         avg_score = result.get("avg_score", 3.5)
         recommendation = result.get("recommendation", "use_descriptions")
@@ -247,17 +248,3 @@ def _truncate_content(content: str, max_length: int = 2000) -> str:
     if len(content) > max_length:
         return content[:max_length] + "..."
     return content
-
-
-def _parse_llm_response(response_text: str) -> dict:
-    """Parse LLM response, handling markdown code blocks."""
-    clean_text = response_text.strip()
-
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
-
-    return json.loads(clean_text)
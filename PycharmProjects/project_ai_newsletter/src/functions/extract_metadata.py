@@ -8,12 +8,13 @@ import json
 from typing import TypedDict, Optional
 
 from dotenv import load_dotenv
-import anthropic
 
 # Load environment variables
 load_dotenv()
 
 from src.utils import load_prompt
+from src.utils.llm_clients import get_anthropic_client
+from src.utils.json_parse import parse_json_response
 from src.config import load_config_settings
 from src.tracking import track_llm_cost, debug_log, track_time
 
@@ -173,12 +174,12 @@ def _extract_batch(
         for a in articles
     ]
 
-    user_message = json.dumps({"articles": articles_for_llm}, indent=2)
+    user_message = json.dumps({"articles": articles_for_llm}, ensure_ascii=False, separators=(",", ":"))
 
     debug_log(f"[LLM INPUT]: Extracting metadata for {len(articles)} articles")
 
     # Make LLM call
-    client = anthropic.Anthropic()
+    client = get_anthropic_client()
 
     response = client.messages.create(
         model="claude-haiku-4-5-20251001",
@@ -201,7 +202,7 @@ def _extract_batch(
 
     # Parse response
     try:
-        result = _parse_llm_response(response_text)
+        result = parse_json_response(response_text)
 
         # Convert to dict by URL
         extractions = {}
@@ -250,17 +251,3 @@ def _log_distribution(articles: list[EnrichedArticle]) -> None:
     debug_log(f"[NODE: extract_metadata] Region distribution: {region_counts}")
     debug_log(f"[NODE: extract_metadata] Category distribution: {category_counts}")
     debug_log(f"[NODE: extract_metadata] Layer distribution: {layer_counts}")
-
-
-def _parse_llm_response(response_text: str) -> dict:
-    """Parse LLM response, handling markdown code blocks."""
-    clean_text = response_text.strip()
-
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
-
-    return json.loads(clean_text)
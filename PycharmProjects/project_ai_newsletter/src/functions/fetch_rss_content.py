@@ -5,6 +5,7 @@ Fetches and parses RSS XML from all available feeds,
 extracting article metadata and content.
 """
 
+import html as html_lib
 import re
 import time
 from datetime import datetime
@@ -29,6 +30,18 @@ BROWSER_HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
+# HTML cleanup patterns (compiled once - applied to every description and page)
+_CDATA_RE = re.compile(r"<!\[CDATA\[|\]\]>")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+# Non-content blocks removed in one pass: scripts/styles, then page chrome
+_BOILERPLATE_RE = re.compile(
+    r"<(script|style|noscript|nav|header|footer|aside)\b[^>]*>.*?</\1\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+_ARTICLE_RE = re.compile(r"<article[^>]*>(.*?)</article>", re.DOTALL | re.IGNORECASE)
+_MAIN_RE = re.compile(r"<main[^>]*>(.*?)</main>", re.DOTALL | re.IGNORECASE)
+
 
 class RSSArticle(TypedDict):
     """Raw article from RSS feed."""
@@ -273,21 +286,16 @@ def _clean_html(text: str) -> str:
         return ""
 
     # Remove CDATA wrappers
-    text = re.sub(r'<!\[CDATA\[|\]\]>', '', text)
+    text = _CDATA_RE.sub('', text)
 
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
+    text = _TAG_RE.sub(' ', text)
 
-    # Decode common entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
+    # Decode entities (named and numeric) in one pass
+    text = html_lib.unescape(text)
 
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
 
     return text.strip()
 
@@ -336,44 +344,25 @@ def extract_article_text(html: str) -> str:
     Returns:
         Cleaned article text
     """
-    # Remove script and style elements
-    text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<noscript[^>]*>.*?</noscript>', '', text, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove navigation, header, footer, sidebar
-    text = re.sub(r'<nav[^>]*>.*?</nav>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<header[^>]*>.*?</header>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<footer[^>]*>.*?</footer>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<aside[^>]*>.*?</aside>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    # Remove script/style elements and navigation, header, footer, sidebar
+    text = _BOILERPLATE_RE.sub('', html)
 
     # Try to extract article or main content
-    article_match = re.search(r'<article[^>]*>(.*?)</article>', text, flags=re.DOTALL | re.IGNORECASE)
+    article_match = _ARTICLE_RE.search(text)
     if article_match:
         text = article_match.group(1)
     else:
-        main_match = re.search(r'<main[^>]*>(.*?)</main>', text, flags=re.DOTALL | re.IGNORECASE)
+        main_match = _MAIN_RE.search(text)
         if main_match:
             text = main_match.group(1)
 
     # Remove all remaining HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-
-    # Decode entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
-    text = text.replace("&rsquo;", "'")
-    text = text.replace("&lsquo;", "'")
-    text = text.replace("&rdquo;", '"')
-    text = text.replace("&ldquo;", '"')
-    text = text.replace("&mdash;", "—")
-    text = text.replace("&ndash;", "–")
+    text = _TAG_RE.sub(' ', text)
+
+    # Decode entities (named and numeric) in one pass
+    text = html_lib.unescape(text)
 
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
 
     return text
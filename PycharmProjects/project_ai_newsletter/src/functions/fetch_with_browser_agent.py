@@ -7,10 +7,16 @@ sources blocked by CAPTCHA/Cloudflare.
 
 import asyncio
 import json
+import re
 from datetime import datetime
 from typing import TypedDict, Optional
 
 from src.tracking import debug_log, track_time, track_llm_cost
+from src.utils.json_parse import strip_fences
+
+
+# Matches the outermost JSON array embedded in free-form agent output
+_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
 
 
 class ExtractedArticle(TypedDict):
@@ -76,38 +82,58 @@ async def fetch_with_browser_agent(state: dict) -> dict:
         # Initialize LLM
         llm = ChatAnthropic(model=model)
 
-        # Process each source
-        for source in sources:
-            url = source["url"]
-            name = source["name"]
-
-            debug_log(f"[NODE: fetch_with_browser_agent] Processing: {name} ({url})")
+        # One browser for all sources - launching Chrome per source dominates
+        # cold-start time. keep_alive stops each Agent from killing it on exit.
+        # NOTE: Do NOT pass 'timeout' param - in browser-use 0.11.x it triggers cloud mode!
+        browser = Browser(
+            headless=headless,
+            is_local=True,  # Force local browser
+            use_cloud=False,  # Explicitly disable cloud service
+            keep_alive=True,  # Reused across sources, killed once below
+            minimum_wait_page_load_time=3,  # Wait at least 3s for page load
+            wait_for_network_idle_page_load_time=10,  # Wait for network idle
+        )
 
+        try:
+            # Process each source
+            for source in sources:
+                url = source["url"]
+                name = source["name"]
+
+                debug_log(f"[NODE: fetch_with_browser_agent] Processing: {name} ({url})")
+
+                try:
+                    articles = await _scrape_source_with_agent(
+                        url=url,
+                        source_name=name,
+                        llm=llm,
+                        browser=browser,
+                        max_articles=max_articles,
+                    )
+
+                    all_articles.extend(articles)
+                    debug_log(f"[NODE: fetch_with_browser_agent]   Extracted {len(articles)} articles from {name}")
+
+                except Exception as e:
+                    debug_log(f"[NODE: fetch_with_browser_agent]   Failed: {type(e).__name__}: {e}", "error")
+                    failures.append({
+                        "url": url,
+                        "name": name,
+                        "error": str(e),
+                        "timestamp": datetime.now().isoformat(),
+                    })
+
+                # Rate limiting between sources
+                if source != sources[-1]:
+                    debug_log("[NODE: fetch_with_browser_agent] Waiting 30s before next source...")
+                    await asyncio.sleep(30)
+
+        finally:
+            # Cleanup - kill() is required because keep_alive ignores stop()
             try:
-                articles = await _scrape_source_with_agent(
-                    url=url,
-                    source_name=name,
-                    llm=llm,
-                    max_articles=max_articles,
-                    headless=headless,
-                )
-
-                all_articles.extend(articles)
-                debug_log(f"[NODE: fetch_with_browser_agent]   Extracted {len(articles)} articles from {name}")
-
-            except Exception as e:
-                debug_log(f"[NODE: fetch_with_browser_agent]   Failed: {type(e).__name__}: {e}", "error")
-                failures.append({
-                    "url": url,
-                    "name": name,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                })
-
-            # Rate limiting between sources
-            if source != sources[-1]:
-                debug_log("[NODE: fetch_with_browser_agent] Waiting 30s before next source...")
-                await asyncio.sleep(30)
+                await browser.kill()
+            except Exception:
+                pass
 
         debug_log(f"[NODE: fetch_with_browser_agent] Total extracted: {len(all_articles)} articles")
         debug_log(f"[NODE: fetch_with_browser_agent] Failures: {len(failures)}")
@@ -122,8 +148,8 @@ async def _scrape_source_with_agent(
     url: str,
     source_name: str,
     llm,
+    browser,
     max_articles: int,
-    headless: bool,
 ) -> list[ExtractedArticle]:
     """
     Scrape a single source using browser-use Agent.
@@ -132,23 +158,13 @@ async def _scrape_source_with_agent(
         url: Source listing page URL
         source_name: Human-readable source name
         llm: ChatAnthropic instance
+        browser: Shared browser-use Browser (keep_alive session)
         max_articles: Max articles to extract
-        headless: Whether to run headless
 
     Returns:
         List of extracted articles
     """
-    from browser_use import Agent, Browser
-
-    # Initialize browser for local mode
-    # NOTE: Do NOT pass 'timeout' param - in browser-use 0.11.x it triggers cloud mode!
-    browser = Browser(
-        headless=headless,
-        is_local=True,  # Force local browser
-        use_cloud=False,  # Explicitly disable cloud service
-        minimum_wait_page_load_time=3,  # Wait at least 3s for page load
-        wait_for_network_idle_page_load_time=10,  # Wait for network idle
-    )
+    from browser_use import Agent
 
     task = f"""
     Go to {url} and:
@@ -179,46 +195,38 @@ async def _scrape_source_with_agent(
         browser=browser,
     )
 
-    try:
-        history = await agent.run(max_steps=25)
-        result = history.final_result()
-
-        if not result:
-            debug_log(f"[_scrape_source_with_agent] No result from agent for {source_name}")
-            return []
-
-        # Parse JSON result
-        articles_data = _parse_agent_result(result)
-
-        # Convert to ExtractedArticle format
-        articles: list[ExtractedArticle] = []
-        for item in articles_data:
-            article_url = item.get("url", "")
-
-            # Make URL absolute if needed
-            if article_url and not article_url.startswith("http"):
-                base_url = url.rstrip("/")
-                if not article_url.startswith("/"):
-                    article_url = "/" + article_url
-                article_url = base_url.split("/")[0] + "//" + base_url.split("/")[2] + article_url
-
-            articles.append(ExtractedArticle(
-                url=article_url,
-                title=item.get("title", ""),
-                content=item.get("content", ""),
-                date=item.get("date"),
-                source_name=source_name,
-                source_url=url,
-            ))
-
-        return articles
-
-    finally:
-        # Cleanup
-        try:
-            await browser.stop()
-        except Exception:
-            pass
+    history = await agent.run(max_steps=25)
+    result = history.final_result()
+
+    if not result:
+        debug_log(f"[_scrape_source_with_agent] No result from agent for {source_name}")
+        return []
+
+    # Parse JSON result
+    articles_data = _parse_agent_result(result)
+
+    # Convert to ExtractedArticle format
+    articles: list[ExtractedArticle] = []
+    for item in articles_data:
+        article_url = item.get("url", "")
+
+        # Make URL absolute if needed
+        if article_url and not article_url.startswith("http"):
+            base_url = url.rstrip("/")
+            if not article_url.startswith("/"):
+                article_url = "/" + article_url
+            article_url = base_url.split("/")[0] + "//" + base_url.split("/")[2] + article_url
+
+        articles.append(ExtractedArticle(
+            url=article_url,
+            title=item.get("title", ""),
+            content=item.get("content", ""),
+            date=item.get("date"),
+            source_name=source_name,
+            source_url=url,
+        ))
+
+    return articles
 
 
 def _parse_agent_result(result: str) -> list[dict]:
@@ -236,18 +244,8 @@ def _parse_agent_result(result: str) -> list[dict]:
     if not result:
         return []
 
-    # Clean up result
-    result = result.strip()
-
-    # Remove markdown code block markers if present
-    if result.startswith("```"):
-        lines = result.split("\n")
-        # Remove first line (```json or ```)
-        lines = lines[1:]
-        # Remove last line if it's ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        result = "\n".join(lines)
+    # Clean up result and remove markdown code block markers if present
+    result = strip_fences(result)
 
     # Try to find JSON array in result
     try:
@@ -260,8 +258,7 @@ def _parse_agent_result(result: str) -> list[dict]:
         pass
 
     # Try to extract JSON array from text
-    import re
-    json_match = re.search(r'\[[\s\S]*\]', result)
+    json_match = _ARRAY_RE.search(result)
     if json_match:
         try:
             data = json.loads(json_match.group())
@@ -6,7 +6,10 @@ non-business content (discard). Filters out technical research,
 tutorials, and other non-business content.
 """
 
+import asyncio
+import html
 import json
+import re
 from typing import TypedDict, Optional
 
 from dotenv import load_dotenv
@@ -15,7 +18,8 @@ import anthropic
 # Load environment variables
 load_dotenv()
 
-from src.utils import load_prompt
+from src.utils import batched, load_prompt
+from src.utils.json_parse import parse_json_response
 from src.tracking import track_llm_cost, debug_log, track_time
 
 
@@ -47,6 +51,18 @@ class DiscardedArticle(TypedDict):
 BATCH_SIZE = 25
 FALLBACK_BATCH_SIZES = [15, 10]
 
+# Retries with parse-error feedback before falling back to smaller batches
+PARSE_RETRIES = 2
+
+# Max batches in flight at once (well within Haiku rate limits)
+MAX_CONCURRENT_BATCHES = 8
+
+# Max description length sent to the LLM (chars)
+MAX_DESCRIPTION_LENGTH = 500
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
 
 def filter_business_news(state: dict) -> dict:
     """
@@ -67,18 +83,19 @@ def filter_business_news(state: dict) -> dict:
         if not raw_articles:
             return {"filtered_articles": []}
 
-        # Process in batches
-        all_classifications: dict[str, dict] = {}
-
-        for i in range(0, len(raw_articles), BATCH_SIZE):
-            batch = raw_articles[i:i + BATCH_SIZE]
-            batch_num = i // BATCH_SIZE + 1
-            total_batches = (len(raw_articles) + BATCH_SIZE - 1) // BATCH_SIZE
+        # Deduplicate by URL - the same article often appears in multiple feeds.
+        # Classifications are keyed by URL, so every copy gets the same label.
+        unique_by_url: dict[str, dict] = {}
+        for article in raw_articles:
+            unique_by_url.setdefault(article.get("link", ""), article)
+        unique_articles = list(unique_by_url.values())
 
-            debug_log(f"[NODE: filter_business_news] Processing batch {batch_num}/{total_batches}")
+        if len(unique_articles) < len(raw_articles):
+            debug_log(f"[NODE: filter_business_news] Skipping {len(raw_articles) - len(unique_articles)} duplicate URLs")
 
-            classifications = _classify_batch_with_retry(batch)
-            all_classifications.update(classifications)
+        # Process in batches (concurrently)
+        batches = list(batched(unique_articles, BATCH_SIZE))
+        all_classifications = asyncio.run(_classify_batches(batches))
 
         # Apply classifications
         filtered_articles: list[FilteredArticle] = []
@@ -119,7 +136,43 @@ def filter_business_news(state: dict) -> dict:
         return {"filtered_articles": filtered_articles, "discarded_articles": discarded_articles}
 
 
-def _classify_batch_with_retry(articles: list[dict]) -> dict[str, dict]:
+async def _classify_batches(batches: list[list[dict]]) -> dict[str, dict]:
+    """
+    Classify all batches concurrently, at most MAX_CONCURRENT_BATCHES at a time.
+
+    One async client is shared by every batch in the run. It is created here
+    rather than at module level because its connection pool is bound to the
+    event loop started by asyncio.run().
+
+    Args:
+        batches: List of article batches
+
+    Returns:
+        Dict mapping URL to classification {is_business_news, reason}
+    """
+    client = anthropic.AsyncAnthropic()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def classify(batch_num: int, batch: list[dict]) -> dict[str, dict]:
+        async with semaphore:
+            debug_log(f"[NODE: filter_business_news] Processing batch {batch_num}/{len(batches)}")
+            return await _classify_batch_with_retry(client, batch)
+
+    try:
+        results = await asyncio.gather(
+            *(classify(batch_num, batch) for batch_num, batch in enumerate(batches, 1))
+        )
+    finally:
+        await client.close()
+
+    all_classifications: dict[str, dict] = {}
+    for classifications in results:
+        all_classifications.update(classifications)
+
+    return all_classifications
+
+
+async def _classify_batch_with_retry(client: anthropic.AsyncAnthropic, articles: list[dict]) -> dict[str, dict]:
     """
     Classify a batch of articles with automatic retry on smaller batch sizes.
 
@@ -127,13 +180,14 @@ def _classify_batch_with_retry(articles: list[dict]) -> dict[str, dict]:
     and retries with reduced batch sizes (25 -> 15 -> 10).
 
     Args:
+        client: Shared async Anthropic client
         articles: List of article dicts
 
     Returns:
         Dict mapping URL to classification {is_business_news, reason}
     """
     # Try with full batch first
-    success, classifications = _classify_batch(articles, max_tokens=2048)
+    success, classifications = await _classify_batch(client, articles, max_tokens=2048)
 
     if success:
         return classifications
@@ -147,12 +201,11 @@ def _classify_batch_with_retry(articles: list[dict]) -> dict[str, dict]:
         all_success = True
         temp_classifications: dict[str, dict] = {}
 
-        for i in range(0, len(articles), fallback_size):
-            sub_batch = articles[i:i + fallback_size]
+        for sub_batch in batched(articles, fallback_size):
             # Increase max_tokens for smaller batches (more room per article)
             max_tokens = 2048 if fallback_size >= 15 else 3072
 
-            success, sub_classifications = _classify_batch(sub_batch, max_tokens=max_tokens)
+            success, sub_classifications = await _classify_batch(client, sub_batch, max_tokens=max_tokens)
 
             if success:
                 temp_classifications.update(sub_classifications)
@@ -169,11 +222,16 @@ def _classify_batch_with_retry(articles: list[dict]) -> dict[str, dict]:
     return {a.get("link", ""): {"is_business_news": False, "reason": "all_retries_failed"} for a in articles}
 
 
-def _classify_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool, dict[str, dict]]:
+async def _classify_batch(
+    client: anthropic.AsyncAnthropic,
+    articles: list[dict],
+    max_tokens: int = 2048,
+) -> tuple[bool, dict[str, dict]]:
     """
     Classify a batch of articles using LLM.
 
     Args:
+        client: Shared async Anthropic client
         articles: List of article dicts
         max_tokens: Maximum tokens for LLM response
 
@@ -188,78 +246,92 @@ def _classify_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool,
         {
             "url": a.get("link", ""),
             "title": a.get("title", ""),
-            "description": a.get("description", "")[:500],  # Limit description length
+            "description": _prepare_description(a.get("description", "")),
         }
         for a in articles
     ]
 
-    user_message = json.dumps({"articles": articles_for_llm}, indent=2)
+    # Compact JSON - indentation only adds input tokens
+    user_message = json.dumps({"articles": articles_for_llm}, ensure_ascii=False, separators=(",", ":"))
 
     debug_log(f"[LLM INPUT]: System prompt length: {len(system_prompt)}, max_tokens: {max_tokens}, batch_size: {len(articles)}")
     debug_log(f"[LLM INPUT USER]: {user_message[:1000]}...")
 
-    # Make LLM call
-    client = anthropic.Anthropic()
-
-    response = client.messages.create(
-        model="claude-haiku-4-5-20251001",
-        max_tokens=max_tokens,
-        system=system_prompt,
-        messages=[
-            {"role": "user", "content": user_message}
-        ],
-    )
-
-    # Track cost
-    track_llm_cost(
-        model=response.model,
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
-    )
-
-    # Extract response text
-    response_text = response.content[0].text
-    debug_log(f"[LLM OUTPUT]: {response_text}")
-
-    # Parse JSON response
-    try:
-        result = _parse_llm_response(response_text)
-
-        # Convert to dict by URL
-        classifications = {}
-        for item in result.get("classifications", []):
-            url = item.get("url", "")
-            if url:
-                classifications[url] = {
-                    "is_business_news": item.get("is_business_news", True),
-                    "reason": item.get("reason", ""),
-                }
+    messages = [{"role": "user", "content": user_message}]
+
+    for attempt in range(PARSE_RETRIES + 1):
+        # Make LLM call
+        response = await client.messages.create(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=max_tokens,
+            system=system_prompt,
+            messages=messages,
+        )
+
+        # Track cost
+        track_llm_cost(
+            model=response.model,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+
+        # Extract response text
+        response_text = response.content[0].text
+        debug_log(f"[LLM OUTPUT]: {response_text}")
+
+        # Parse JSON response
+        try:
+            result = parse_json_response(response_text)
+
+            # Convert to dict by URL
+            classifications = {}
+            for item in result.get("classifications", []):
+                url = item.get("url", "")
+                if url:
+                    classifications[url] = {
+                        "is_business_news": item.get("is_business_news", True),
+                        "reason": item.get("reason", ""),
+                    }
+
+            return True, classifications
+
+        except Exception as e:
+            debug_log(f"[NODE: filter_business_news] ERROR parsing response: {e}", "error")
+
+            # Truncated output won't be fixed by feedback - let caller split the batch
+            if response.stop_reason == "max_tokens" or attempt == PARSE_RETRIES:
+                break
 
-        return True, classifications
+            # Retry with the parse error fed back to the model
+            debug_log(f"[NODE: filter_business_news] Retrying with parse feedback ({attempt + 1}/{PARSE_RETRIES})")
+            messages = messages + [
+                {"role": "assistant", "content": response_text},
+                {"role": "user", "content": f"Your output had an error: {e}. Return ONLY valid JSON."},
+            ]
+            await asyncio.sleep(1.0 * (attempt + 1))
 
-    except Exception as e:
-        debug_log(f"[NODE: filter_business_news] ERROR parsing response: {e}", "error")
-        return False, {}
+    return False, {}
 
 
-def _parse_llm_response(response_text: str) -> dict:
+def _prepare_description(description: str) -> str:
     """
-    Parse LLM response, handling markdown code blocks.
+    Strip markup from a description and truncate it for the LLM.
+
+    HTML and Twitter/browser-use descriptions may still contain tags and
+    entities, which cost input tokens without helping classification.
 
     Args:
-        response_text: Raw LLM response
+        description: Raw article description
 
     Returns:
-        Parsed JSON dict
+        Plain-text description, at most MAX_DESCRIPTION_LENGTH chars
     """
-    clean_text = response_text.strip()
+    if not description:
+        return ""
 
-    # Remove markdown code blocks if present
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]  # Remove first line with ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
+    # Only pay for cleaning when there is markup to remove
+    if "<" in description or "&" in description:
+        description = html.unescape(_TAG_RE.sub(" ", description))
+        description = _WS_RE.sub(" ", description).strip()
 
-    return json.loads(clean_text)
+    return description[:MAX_DESCRIPTION_LENGTH]
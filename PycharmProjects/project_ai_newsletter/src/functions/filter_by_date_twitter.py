@@ -6,7 +6,7 @@ a configurable threshold. This runs BEFORE LLM-based filtering to
 reduce API costs.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from src.tracking import debug_log, track_time
 
@@ -56,7 +56,7 @@ def filter_by_date_twitter(state: dict) -> dict:
 
             # Parse the date
             try:
-                pub_date = datetime.strptime(pub_date_str, "%Y-%m-%d").date()
+                pub_date = date.fromisoformat(pub_date_str[:10])
             except ValueError:
                 # Keep tweets with unparseable dates
                 debug_log(
@@ -5,11 +5,11 @@ Generates embeddings for articles using OpenAI's text-embedding-3-small model.
 Embeddings are used for semantic similarity comparison in deduplication.
 """
 
-import os
 import numpy as np
-from openai import OpenAI
 
 from src.tracking import debug_log, track_time
+from src.utils import batched
+from src.utils.llm_clients import get_openai_client
 
 
 # =============================================================================
@@ -17,7 +17,12 @@ from src.tracking import debug_log, track_time
 # =============================================================================
 
 EMBEDDING_MODEL = "text-embedding-3-small"
-EMBEDDING_DIMENSIONS = 1536
+# text-embedding-3 models are Matryoshka-trained: the API returns the first N
+# dimensions re-normalized, so 512 keeps dedup quality at 1/3 the size
+EMBEDDING_DIMENSIONS = 512
+# In-memory precision for embeddings (float16 halves state size; cosine
+# similarity is unaffected at this precision). Stored as float32 in the DB.
+EMBEDDING_DTYPE = np.float16
 BATCH_SIZE = 50  # Reduced from 100 to avoid token limit issues
 MAX_TEXT_LENGTH = 500  # Truncate text to avoid exceeding token limits
 
@@ -52,15 +57,7 @@ def create_embedding_text(article: dict) -> str:
     return text
 
 
-def get_openai_client() -> OpenAI:
-    """Get OpenAI client instance."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    return OpenAI(api_key=api_key)
-
-
-def embed_texts(texts: list[str]) -> list[np.ndarray]:
+def embed_texts(texts: list[str]) -> np.ndarray:
     """
     Generate embeddings for a list of texts using OpenAI API.
 
@@ -68,31 +65,30 @@ def embed_texts(texts: list[str]) -> list[np.ndarray]:
         texts: List of text strings to embed.
 
     Returns:
-        List of numpy arrays (embeddings).
+        Matrix of shape (len(texts), EMBEDDING_DIMENSIONS); row i embeds texts[i].
     """
+    embeddings = np.empty((len(texts), EMBEDDING_DIMENSIONS), dtype=EMBEDDING_DTYPE)
+
     if not texts:
-        return []
+        return embeddings
 
     client = get_openai_client()
-    embeddings = []
 
     # Process in batches
-    for i in range(0, len(texts), BATCH_SIZE):
-        batch = texts[i:i + BATCH_SIZE]
+    for batch_num, batch in enumerate(batched(texts, BATCH_SIZE)):
+        offset = batch_num * BATCH_SIZE
 
         response = client.embeddings.create(
             model=EMBEDDING_MODEL,
-            input=batch
+            input=batch,
+            dimensions=EMBEDDING_DIMENSIONS,
         )
 
-        # Extract embeddings in order
-        batch_embeddings = [
-            np.array(item.embedding, dtype=np.float32)
-            for item in sorted(response.data, key=lambda x: x.index)
-        ]
-        embeddings.extend(batch_embeddings)
+        # Write each embedding straight into its row (item.index is batch-relative)
+        for item in response.data:
+            embeddings[offset + item.index] = item.embedding
 
-        debug_log(f"[EMBED] Generated {len(batch)} embeddings (batch {i // BATCH_SIZE + 1})")
+        debug_log(f"[EMBED] Generated {len(batch)} embeddings (batch {batch_num + 1})")
 
     return embeddings
 
@@ -9,8 +9,13 @@ Generates LLM titles and summaries for ALL articles. Each output is:
 Includes validation and retry logic for failed summaries.
 """
 
+import asyncio
 import json
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -19,19 +24,100 @@ import openai
 # Load environment variables
 load_dotenv()
 
-from src.utils import load_prompt
+from src.llm_cache import LLMCache
+from src.utils import batched, load_prompt
+from src.utils.llm_clients import get_openai_client
+from src.utils.json_parse import parse_json_response
+from src.utils.html_clean import RAW_LENGTH_FACTOR, clean_and_truncate
 from src.tracking import track_llm_cost, debug_log, track_time
 
 
-# Batch sizes for LLM calls (with fallback on error)
-BATCH_SIZE = 10
-FALLBACK_BATCH_SIZES = [7, 5]
+SUMMARY_MODEL = "gpt-5-mini"
+
+# Batches are packed by estimated input tokens, capped at MAX_BATCH_SIZE
+# articles (halved on truncation or error, up to MAX_FALLBACK_ROUNDS times)
+BATCH_TOKEN_BUDGET = 12000
+MAX_BATCH_SIZE = 16
+MAX_FALLBACK_ROUNDS = 2
+
+# Articles sharing a title and this many chars of cleaned content are summarized once
+DEDUP_PREFIX_LENGTH = 1000
+
+# Output budget per article in a batch (gpt-5-mini spends some on reasoning)
+OUTPUT_TOKENS_PER_ARTICLE = 400
+MIN_OUTPUT_TOKENS = 4096
+FALLBACK_MIN_OUTPUT_TOKENS = 6144  # fallback batches are small - leave reasoning headroom
+
+# Max batches in flight at once (bounded by provider RPM/TPM limits)
+MAX_CONCURRENT_BATCHES = 8
+
+# OpenAI Batch API (opt-in via USE_BATCH_API=1): ~50% cheaper, up to 24h turnaround
+# Poll interval starts short (small jobs finish in minutes) and backs off
+BATCH_API_POLL_INITIAL_SECONDS = 10
+BATCH_API_POLL_MAX_SECONDS = 300
+BATCH_API_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Structured output - the API guarantees JSON matching this schema, so batches
+# no longer fail on fenced or malformed JSON (only on truncation)
+SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "article_summaries",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "url": {"type": "string"},
+                            "title": {"type": "string"},
+                            "summary": {"type": "string"},
+                        },
+                        "required": ["url", "title", "summary"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["summaries"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 # Validation constants
 MAX_SUMMARY_LENGTH = 250  # chars - 1-2 sentences should be under this
 MIN_KOREAN_RATIO = 0.2    # at least 20% Korean characters (allows English proper nouns)
 MAX_RETRIES = 3           # max retry attempts for failed summaries
 
+# The LLM only ever sees the first 3000 chars of cleaned text, taken from at most
+# this much raw content - a verbatim copy can't come from further in
+COPY_CHECK_WINDOW = 3000 * RAW_LENGTH_FACTOR
+
+# Extra instruction sent with a single-article retry, by validation failure reason
+RETRY_INSTRUCTIONS = {
+    "too_long": """CRITICAL: Your previous summary was TOO LONG.
+You MUST output a summary under 200 characters (about 1-2 sentences).
+DO NOT copy the original text. SUMMARIZE it briefly.""",
+    "not_korean": """CRITICAL: Your previous summary was in ENGLISH, not Korean.
+You MUST output the summary in Korean (한국어).
+Translate and summarize ALL content to Korean.""",
+    "not_summarized": """CRITICAL: Your previous output was just the original content, not a summary.
+You MUST SUMMARIZE the content into 1-2 concise Korean sentences.
+DO NOT copy the original text verbatim.""",
+}
+
+_WS_RE = re.compile(r"\s+")
+# Runs (not single chars) - far fewer matches to allocate; counts are summed run lengths
+_KOREAN_RUN_RE = re.compile(r"[가-힣]+")
+_WORD_CHAR_RUN_RE = re.compile(r"[a-zA-Z가-힣0-9]+")
+
+# Start of the items array, and the gap between items, in a summaries response
+_SUMMARIES_ARRAY_RE = re.compile(r'"summaries"\s*:\s*\[')
+_ITEM_SEPARATOR_RE = re.compile(r"[\s,]*")
+
 
 def _validate_summary(summary: str, original_content: str) -> tuple[bool, str]:
     """
@@ -57,28 +143,35 @@ def _validate_summary(summary: str, original_content: str) -> tuple[bool, str]:
         return False, "too_long"
 
     # Check 2: Contains Korean (at least MIN_KOREAN_RATIO Korean chars)
-    korean_chars = len(re.findall(r'[가-힣]', summary))
-    total_chars = len(re.findall(r'[a-zA-Z가-힣0-9]', summary))
+    korean_chars = sum(map(len, _KOREAN_RUN_RE.findall(summary)))
+    total_chars = sum(map(len, _WORD_CHAR_RUN_RE.findall(summary)))
     if total_chars > 0 and korean_chars / total_chars < MIN_KOREAN_RATIO:
         return False, "not_korean"
 
     # Check 3: Not just truncated original content
     if original_content:
-        # Clean the original for comparison
-        clean_original = re.sub(r'\s+', ' ', original_content).strip()
-        clean_summary = re.sub(r'\s+', ' ', summary).strip()
+        # Clean the original for comparison (memoized - retries re-validate the same article)
+        clean_original = _normalize_whitespace(original_content[:COPY_CHECK_WINDOW])
+        clean_summary = _WS_RE.sub(' ', summary).strip()
 
-        # Check if summary is a substring of original (just truncated)
-        if len(clean_summary) > 50 and clean_summary in clean_original:
+        # Check if summary starts with the same content as original (O(80), so first)
+        if len(clean_original) > 100 and clean_summary[:80] == clean_original[:80]:
             return False, "not_summarized"
 
-        # Check if summary starts with the same content as original
-        if len(clean_original) > 100 and clean_summary[:80] == clean_original[:80]:
+        # Check if summary is a substring of original (just truncated).
+        # A summary longer than the original can't be contained in it.
+        if 50 < len(clean_summary) <= len(clean_original) and clean_summary in clean_original:
             return False, "not_summarized"
 
     return True, "valid"
 
 
+@lru_cache(maxsize=1024)
+def _normalize_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces."""
+    return _WS_RE.sub(' ', text).strip()
+
+
 def generate_summaries(state: dict) -> dict:
     """
     Generate LLM titles and summaries for ALL articles.
@@ -98,24 +191,46 @@ def generate_summaries(state: dict) -> dict:
         if not enriched_articles:
             return {"enriched_articles": enriched_articles}
 
+        # Articles with no text at all can't be summarized - keep them out of the LLM batches.
+        # The source text is resolved once here and reused for validation below.
+        summarizable: list[dict] = []
+        no_content_urls: set[str] = set()
+        original_contents: dict[str, str] = {}
+        for article in enriched_articles:
+            url = article.get("link", "")
+            original_content = article.get("full_content") or article.get("description", "")
+            original_contents[url] = original_content
+
+            if original_content:
+                summarizable.append(article)
+            else:
+                no_content_urls.add(url)
+
+        if no_content_urls:
+            debug_log(f"[NODE: generate_summaries] Skipping LLM for {len(no_content_urls)} articles without content")
+
         # Generate titles and summaries for all articles
-        all_summaries, all_titles = _generate_summaries_with_retry(enriched_articles)
+        all_summaries, all_titles, cached_urls = _generate_summaries_with_retry(summarizable)
 
         # Apply titles and summaries to articles, with validation
         summarized_count = 0
         fallback_count = 0
         retry_count = 0
         validation_stats = {"too_long": 0, "not_korean": 0, "not_summarized": 0, "valid": 0}
+        pending_retries: list[tuple[dict, str]] = []
 
         for article in enriched_articles:
             url = article.get("link", "")
-            original_content = article.get("full_content") or article.get("description", "")
+            original_content = original_contents[url]
 
             if url in all_summaries and all_summaries[url]:
                 summary = all_summaries[url]
 
-                # Validate the summary
-                is_valid, reason = _validate_summary(summary, original_content)
+                # Validate the summary (cache entries were validated before being stored)
+                if url in cached_urls:
+                    is_valid, reason = True, "valid"
+                else:
+                    is_valid, reason = _validate_summary(summary, original_content)
                 validation_stats[reason] = validation_stats.get(reason, 0) + 1
 
                 if is_valid:
@@ -123,31 +238,39 @@ def generate_summaries(state: dict) -> dict:
                     if url in all_titles and all_titles[url]:
                         article["title"] = all_titles[url]
                     article["contents"] = summary
-                    article["content_source"] = "llm_summary"
+                    article["content_source"] = "llm_summary_cached" if url in cached_urls else "llm_summary"
                     summarized_count += 1
                 else:
-                    # Validation failed - retry with single article
+                    # Validation failed - retry with single article (below, in parallel)
                     debug_log(f"[NODE: generate_summaries] Validation failed ({reason}): {article.get('title', '')[:50]}...")
-                    retry_summary, retry_title = _retry_single_article(article, reason)
-
-                    if retry_summary:
-                        if retry_title:
-                            article["title"] = retry_title
-                        article["contents"] = retry_summary
-                        article["content_source"] = "llm_summary_retry"
-                        summarized_count += 1
-                        retry_count += 1
-                    else:
-                        # All retries failed - fallback
-                        article["contents"] = article.get("description", "")
-                        article["content_source"] = "description_fallback"
-                        article["fallback_reason"] = f"validation_failed:{reason}"
-                        fallback_count += 1
+                    pending_retries.append((article, reason))
             else:
                 # No summary returned - fallback to description
                 article["contents"] = article.get("description", "")
                 article["content_source"] = "description_fallback"
-                article["fallback_reason"] = "llm_no_response"
+                article["fallback_reason"] = "no_content" if url in no_content_urls else "llm_no_response"
+                fallback_count += 1
+
+        # Single-article retries are independent blocking calls - run them on threads
+        if pending_retries:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as executor:
+                retry_results = list(executor.map(lambda item: _retry_single_article(*item), pending_retries))
+        else:
+            retry_results = []
+
+        for (article, reason), (retry_summary, retry_title) in zip(pending_retries, retry_results):
+            if retry_summary:
+                if retry_title:
+                    article["title"] = retry_title
+                article["contents"] = retry_summary
+                article["content_source"] = "llm_summary_retry"
+                summarized_count += 1
+                retry_count += 1
+            else:
+                # All retries failed - fallback
+                article["contents"] = article.get("description", "")
+                article["content_source"] = "description_fallback"
+                article["fallback_reason"] = f"validation_failed:{reason}"
                 fallback_count += 1
 
         debug_log(f"[NODE: generate_summaries] Summarized: {summarized_count}, Retried: {retry_count}, Fallback: {fallback_count}")
@@ -157,150 +280,457 @@ def generate_summaries(state: dict) -> dict:
         return {"enriched_articles": enriched_articles}
 
 
-def _generate_summaries_with_retry(articles: list[dict]) -> tuple[dict[str, str], dict[str, str]]:
+def _generate_summaries_with_retry(articles: list[dict]) -> tuple[dict[str, str], dict[str, str], set[str]]:
     """
     Generate titles and summaries for all articles with adaptive batch retry.
 
-    On parse errors, retries with smaller batch sizes (10 -> 7 -> 5).
+    Articles are packed into batches by estimated token count. On
+    truncation or parse errors, the articles still missing a summary are
+    retried in batches of half the size (never below one article), up to
+    MAX_FALLBACK_ROUNDS times (see _summarize_batch_with_retry).
+    Articles summarized by a previous run with the same model, prompt and
+    content are served from the persistent LLM cache instead.
+
+    Args:
+        articles: List of articles to summarize
+
+    Returns:
+        Tuple of (summaries dict, titles dict, URLs served from the cache)
+    """
+    # Serve unchanged articles from the cache
+    cache = LLMCache("generate_summaries")
+    system_prompt = load_prompt("generate_summary_system_prompt.md")
+    cache_keys = [_summary_cache_key(a, system_prompt) for a in articles]
+    cached = cache.get_many(cache_keys)
+
+    all_summaries: dict[str, str] = {}
+    all_titles: dict[str, str] = {}
+    cached_urls: set[str] = set()
+    to_call: list[tuple[str, dict]] = []
+
+    for key, article in zip(cache_keys, articles):
+        url = article.get("link", "")
+        hit = cached.get(key)
+        if hit:
+            all_summaries[url] = hit["summary"]
+            if hit.get("title"):
+                all_titles[url] = hit["title"]
+            cached_urls.add(url)
+        else:
+            to_call.append((key, article))
+
+    debug_log(f"[NODE: generate_summaries] Cache hits: {len(articles) - len(to_call)}, LLM calls needed: {len(to_call)}")
+
+    if not to_call:
+        return all_summaries, all_titles, cached_urls
+
+    # Stories republished under several URLs (same title and opening text) are
+    # summarized once, then fanned out to every copy
+    representatives: dict[str, dict] = {}
+    copies_of: dict[str, list[str]] = {}
+    for _, article in to_call:
+        content = clean_and_truncate(article.get("full_content") or article.get("description", ""))
+        dedup_key = LLMCache.make_key(article.get("title", ""), content[:DEDUP_PREFIX_LENGTH])
+        representative = representatives.setdefault(dedup_key, article)
+        if representative is not article:
+            copies_of.setdefault(representative.get("link", ""), []).append(article.get("link", ""))
+
+    if len(representatives) < len(to_call):
+        debug_log(f"[NODE: generate_summaries] Collapsed {len(to_call) - len(representatives)} duplicate articles")
+
+    batches = _pack_batches(list(representatives.values()))
+    debug_log(f"[NODE: generate_summaries] Packed {len(representatives)} articles into {len(batches)} batches")
+
+    if os.getenv("USE_BATCH_API") == "1":
+        # Offline runs can trade latency for cost via the Batch API
+        summaries, titles = _summarize_via_batch_api(batches)
+    else:
+        # Process in batches (concurrently)
+        summaries, titles = asyncio.run(_summarize_batches(batches))
+
+    for representative_url, copy_urls in copies_of.items():
+        for copy_url in copy_urls:
+            if representative_url in summaries:
+                summaries[copy_url] = summaries[representative_url]
+            if representative_url in titles:
+                titles[copy_url] = titles[representative_url]
+
+    all_summaries.update(summaries)
+    all_titles.update(titles)
+
+    # Only cache valid summaries - invalid ones should be retried next run
+    new_entries = {}
+    for key, article in to_call:
+        url = article.get("link", "")
+        summary = summaries.get(url)
+        original_content = article.get("full_content") or article.get("description", "")
+        if summary and _validate_summary(summary, original_content)[0]:
+            new_entries[key] = {"summary": summary, "title": titles.get(url, "")}
+    cache.set_many(new_entries)
+
+    return all_summaries, all_titles, cached_urls
+
+
+def _pack_batches(articles: list[dict]) -> list[list[dict]]:
+    """
+    Pack articles into batches by estimated input tokens.
+
+    Short articles share a call instead of padding out a fixed count, and a
+    few long ones no longer overflow the output budget together.
 
     Args:
         articles: List of articles to summarize
 
+    Returns:
+        List of batches, each within BATCH_TOKEN_BUDGET and MAX_BATCH_SIZE
+    """
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    current_tokens = 0
+
+    for article in articles:
+        tokens = _estimate_input_tokens(article)
+
+        if current and (current_tokens + tokens > BATCH_TOKEN_BUDGET or len(current) >= MAX_BATCH_SIZE):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+
+        current.append(article)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _estimate_input_tokens(article: dict) -> int:
+    """Rough input-token estimate for an article (~4 chars/token plus title/JSON overhead)."""
+    return len(clean_and_truncate(article.get("full_content") or article.get("description", ""))) // 4 + 50
+
+
+def _output_token_budget(batch_size: int) -> int:
+    """Max completion tokens for a batch of the given size."""
+    return max(MIN_OUTPUT_TOKENS, batch_size * OUTPUT_TOKENS_PER_ARTICLE)
+
+
+def _summary_cache_key(article: dict, system_prompt: str) -> str:
+    """
+    Build the LLM cache key for an article's summary.
+
+    Covers everything that determines the LLM output: model, system prompt,
+    and the cleaned content and title actually sent.
+
+    Args:
+        article: Article dict
+        system_prompt: Summary system prompt for the current config
+
+    Returns:
+        Cache key
+    """
+    return LLMCache.make_key(
+        SUMMARY_MODEL,
+        system_prompt,
+        article.get("title", ""),
+        clean_and_truncate(article.get("full_content") or article.get("description", "")),
+    )
+
+
+def _summarize_via_batch_api(batches: list[list[dict]]) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Summarize all batches through the OpenAI Batch API.
+
+    Every batch becomes one request line in a single uploaded JSONL file; the
+    job is polled until it finishes. Batches the job doesn't deliver (failed
+    requests, unparseable output, or a job that never completes) are re-run
+    through the real-time path so they still get the fallback-size retries.
+
+    Args:
+        batches: List of article batches
+
     Returns:
         Tuple of (summaries dict, titles dict) mapping URL to content
     """
+    client = get_openai_client()
+
+    request_lines = [
+        json.dumps({
+            "custom_id": str(batch_index),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": SUMMARY_MODEL,
+                "max_completion_tokens": _output_token_budget(len(batch)),
+                "messages": _build_batch_messages([_serialize_article(a) for a in batch]),
+                "response_format": SUMMARY_RESPONSE_FORMAT,
+            },
+        }, ensure_ascii=False)
+        for batch_index, batch in enumerate(batches)
+    ]
+
+    input_file = client.files.create(
+        file=("summaries.jsonl", "\n".join(request_lines).encode("utf-8")),
+        purpose="batch",
+    )
+    job = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    debug_log(f"[NODE: generate_summaries] Submitted batch job {job.id} ({len(batches)} requests)")
+
+    poll_seconds = BATCH_API_POLL_INITIAL_SECONDS
+    while job.status not in BATCH_API_TERMINAL_STATUSES:
+        time.sleep(poll_seconds)
+        poll_seconds = min(poll_seconds * 2, BATCH_API_POLL_MAX_SECONDS)
+        job = client.batches.retrieve(job.id)
+        debug_log(f"[NODE: generate_summaries] Batch job {job.id}: {job.status}")
+
     all_summaries: dict[str, str] = {}
     all_titles: dict[str, str] = {}
+    delivered: set[int] = set()
+
+    if job.status == "completed" and job.output_file_id:
+        output = client.files.content(job.output_file_id).text
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+
+            usage = body.get("usage")
+            if usage:
+                track_llm_cost(
+                    model=body.get("model", SUMMARY_MODEL),
+                    input_tokens=usage["prompt_tokens"],
+                    output_tokens=usage["completion_tokens"],
+                )
+
+            try:
+                response_text = body["choices"][0]["message"]["content"]
+                summaries, titles = _extract_summaries(parse_json_response(response_text))
+            except Exception as e:
+                debug_log(f"[NODE: generate_summaries] ERROR parsing batch {record.get('custom_id')}: {e}", "error")
+                continue
+
+            all_summaries.update(summaries)
+            all_titles.update(titles)
+            delivered.add(int(record["custom_id"]))
+    else:
+        debug_log(f"[NODE: generate_summaries] Batch job {job.id} ended with status {job.status}", "error")
+
+    # Anything the job didn't deliver goes through the real-time path
+    remaining = [batch for batch_index, batch in enumerate(batches) if batch_index not in delivered]
+    if remaining:
+        debug_log(f"[NODE: generate_summaries] Re-running {len(remaining)} batches in real time")
+        summaries, titles = asyncio.run(_summarize_batches(remaining))
+        all_summaries.update(summaries)
+        all_titles.update(titles)
+
+    return all_summaries, all_titles
+
+
+async def _summarize_batches(batches: list[list[dict]]) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Summarize all batches concurrently, at most MAX_CONCURRENT_BATCHES at a time.
+
+    All batches share one client, scoped to this event loop. A batch that
+    raises only affects its own articles (they fall back to descriptions);
+    the other batches still complete.
+
+    Args:
+        batches: List of article batches
+
+    Returns:
+        Tuple of (summaries dict, titles dict) mapping URL to content
+    """
+    client = openai.AsyncOpenAI()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    # Largest batch size still worth trying this run (lowered on fallback success)
+    run_state = {"batch_size_cap": MAX_BATCH_SIZE}
+
+    async def summarize(batch_num: int, batch: list[dict]) -> tuple[dict[str, str], dict[str, str]]:
+        async with semaphore:
+            debug_log(f"[NODE: generate_summaries] Processing batch {batch_num}/{len(batches)}")
+            return await _summarize_batch_with_retry(client, batch, run_state)
+
+    try:
+        results = await asyncio.gather(
+            *(summarize(batch_num, batch) for batch_num, batch in enumerate(batches, 1)),
+            return_exceptions=True,
+        )
+    finally:
+        await client.close()
 
-    # Process in batches
-    for i in range(0, len(articles), BATCH_SIZE):
-        batch = articles[i:i + BATCH_SIZE]
-        batch_num = i // BATCH_SIZE + 1
-        total_batches = (len(articles) + BATCH_SIZE - 1) // BATCH_SIZE
+    all_summaries: dict[str, str] = {}
+    all_titles: dict[str, str] = {}
 
-        debug_log(f"[NODE: generate_summaries] Processing batch {batch_num}/{total_batches}")
+    for batch_num, result in enumerate(results, 1):
+        if isinstance(result, BaseException):
+            debug_log(f"[NODE: generate_summaries] Batch {batch_num} failed: {type(result).__name__}: {result}", "error")
+            continue
 
-        summaries, titles = _summarize_batch_with_retry(batch)
+        summaries, titles = result
         all_summaries.update(summaries)
         all_titles.update(titles)
 
     return all_summaries, all_titles
 
 
-def _summarize_batch_with_retry(articles: list[dict]) -> tuple[dict[str, str], dict[str, str]]:
+async def _summarize_batch_with_retry(
+    client: openai.AsyncOpenAI,
+    articles: list[dict],
+    run_state: dict,
+) -> tuple[dict[str, str], dict[str, str]]:
     """
-    Summarize a batch with automatic retry on smaller batch sizes.
+    Summarize a batch, halving the batch size on truncation or error.
+
+    Each fallback round only re-sends the articles still missing a summary.
+    Sizes never drop below one article, so a small batch (e.g. a packed
+    tail of one) still gets MAX_FALLBACK_ROUNDS solo retries with the
+    FALLBACK_MIN_OUTPUT_TOKENS budget.
+    Once a smaller size has rescued a batch, later batches in the same run
+    start at that size rather than spending a call on a size that failed.
 
     Args:
+        client: Shared async OpenAI client
         articles: List of articles to summarize
+        run_state: Run-local state shared by all batches ('batch_size_cap')
 
     Returns:
         Tuple of (summaries dict, titles dict) mapping URL to content
     """
-    # Try with full batch first
-    success, summaries, titles = _summarize_batch(articles, max_tokens=4096)
+    cap = run_state["batch_size_cap"]
 
-    if success:
-        return summaries, titles
+    # Serialize each article once - fallback sub-batches only re-join the strings
+    payloads = [_serialize_article(a) for a in articles]
+    urls = [a.get("link", "") for a in articles]
+    summaries: dict[str, str] = {}
+    titles: dict[str, str] = {}
 
-    # Retry with smaller batch sizes
-    for fallback_size in FALLBACK_BATCH_SIZES:
-        debug_log(f"[NODE: generate_summaries] Retrying with batch size {fallback_size}")
+    # Try with full batch first (unless this run has shown it's too big)
+    if len(articles) <= cap:
+        success, summaries, titles = await _summarize_batch(
+            client, payloads, max_tokens=_output_token_budget(len(articles))
+        )
 
-        all_success = True
-        temp_summaries: dict[str, str] = {}
-        temp_titles: dict[str, str] = {}
+        if success:
+            return summaries, titles
 
-        for i in range(0, len(articles), fallback_size):
-            sub_batch = articles[i:i + fallback_size]
-            # Increase max_tokens for smaller batches
-            max_tokens = 4096 if fallback_size >= 7 else 6144
+        fallback_size = max(1, len(articles) // 2)
+    else:
+        fallback_size = cap
 
-            success, sub_summaries, sub_titles = _summarize_batch(sub_batch, max_tokens=max_tokens)
+    # Retry with halved batch sizes; a truncated response keeps the summaries it completed
+    for _ in range(MAX_FALLBACK_ROUNDS):
+        pending = [payload for payload, url in zip(payloads, urls) if url not in summaries]
+        if not pending:
+            break
 
-            if success:
-                temp_summaries.update(sub_summaries)
-                temp_titles.update(sub_titles)
-            else:
-                all_success = False
-                break
+        debug_log(f"[NODE: generate_summaries] Retrying {len(pending)} articles with batch size {fallback_size}")
+
+        all_success = True
+        for sub_batch in batched(pending, fallback_size):
+            # Smaller batches get more output headroom per article
+            max_tokens = max(FALLBACK_MIN_OUTPUT_TOKENS, _output_token_budget(len(sub_batch)))
+
+            success, sub_summaries, sub_titles = await _summarize_batch(client, sub_batch, max_tokens=max_tokens)
+
+            summaries.update(sub_summaries)
+            titles.update(sub_titles)
+            all_success = all_success and success
 
         if all_success:
             debug_log(f"[NODE: generate_summaries] Retry with batch size {fallback_size} succeeded")
-            return temp_summaries, temp_titles
+            run_state["batch_size_cap"] = min(run_state["batch_size_cap"], fallback_size)
+            return summaries, titles
 
-    # All retries failed - return empty (will fall back to descriptions)
-    debug_log(f"[NODE: generate_summaries] All retries failed for {len(articles)} articles", "error")
-    return {}, {}
+        fallback_size = max(1, fallback_size // 2)
 
+    # Whatever is still missing will fall back to descriptions
+    missing = sum(1 for url in urls if url not in summaries)
+    if missing:
+        debug_log(f"[NODE: generate_summaries] All retries failed for {missing} articles", "error")
+    return summaries, titles
 
-def _summarize_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool, dict[str, str], dict[str, str]]:
+
+async def _summarize_batch(
+    client: openai.AsyncOpenAI,
+    payloads: list[str],
+    max_tokens: int = 2048,
+) -> tuple[bool, dict[str, str], dict[str, str]]:
     """
     Summarize a single batch of articles using LLM.
 
     Args:
-        articles: List of articles to summarize
+        client: Shared async OpenAI client
+        payloads: Serialized articles (from _serialize_article)
         max_tokens: Maximum tokens for LLM response
 
     Returns:
-        Tuple of (success: bool, summaries: dict, titles: dict)
+        Tuple of (success: bool, summaries: dict, titles: dict). A truncated
+        response is a failure but still carries the items it completed.
     """
-    # Load system prompt
-    system_prompt = load_prompt("generate_summary_system_prompt.md")
+    messages = _build_batch_messages(payloads)
 
-    # Prepare articles for LLM - use full_content if available, else description
-    articles_for_llm = [
-        {
-            "url": a.get("link", ""),
-            "title": a.get("title", ""),
-            "full_content": _clean_and_truncate(
-                a.get("full_content") or a.get("description", "")
-            ),
-        }
-        for a in articles
-    ]
+    debug_log(f"[LLM INPUT]: Summarizing {len(payloads)} articles, max_tokens: {max_tokens}")
 
-    user_message = json.dumps({"articles": articles_for_llm}, indent=2)
-
-    debug_log(f"[LLM INPUT]: Summarizing {len(articles)} articles, max_tokens: {max_tokens}")
-
-    # Make LLM call
-    client = openai.OpenAI()
-
-    response = client.chat.completions.create(
-        model="gpt-5-mini",
+    # Make LLM call (streamed - long reasoning calls keep the connection active,
+    # and usage arrives in the final chunk)
+    stream = await client.chat.completions.create(
+        model=SUMMARY_MODEL,
         max_completion_tokens=max_tokens,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ],
+        messages=messages,
+        response_format=SUMMARY_RESPONSE_FORMAT,
+        stream=True,
+        stream_options={"include_usage": True},
     )
 
-    # Track cost
-    track_llm_cost(
-        model=response.model,
-        input_tokens=response.usage.prompt_tokens,
-        output_tokens=response.usage.completion_tokens,
-    )
+    text_parts: list[str] = []
+    finish_reason = None
+    model = SUMMARY_MODEL
+    usage = None
+
+    async for chunk in stream:
+        model = chunk.model or model
+        if chunk.usage:
+            usage = chunk.usage
+        if chunk.choices:
+            choice = chunk.choices[0]
+            if choice.delta and choice.delta.content:
+                text_parts.append(choice.delta.content)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
 
-    response_text = response.choices[0].message.content
+    # Track cost
+    if usage:
+        track_llm_cost(
+            model=model,
+            input_tokens=usage.prompt_tokens,
+            output_tokens=usage.completion_tokens,
+        )
+
+        # OpenAI reuses the shared system-prompt prefix automatically across calls
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details and details.cached_tokens:
+            debug_log(f"[LLM CACHE]: {details.cached_tokens:,} prompt tokens served from prefix cache")
+
+    response_text = "".join(text_parts)
     debug_log(f"[LLM OUTPUT]: {response_text[:500]}...")
 
+    if finish_reason == "length":
+        debug_log(f"[NODE: generate_summaries] Response truncated at max_tokens={max_tokens}", "warning")
+        # Items closed before the cut are complete - return them with the failure
+        summaries, titles = _extract_summaries(_parse_completed_items(response_text))
+        return False, summaries, titles
+
     # Parse response
     try:
-        result = _parse_llm_response(response_text)
-
-        summaries = {}
-        titles = {}
-        for item in result.get("summaries", []):
-            url = item.get("url", "")
-            summary = item.get("summary", "")
-            title = item.get("title", "")
-            if url and summary:
-                summaries[url] = summary
-            if url and title:
-                titles[url] = title
-
+        summaries, titles = _extract_summaries(parse_json_response(response_text))
         return True, summaries, titles
 
     except Exception as e:
@@ -308,55 +738,106 @@ def _summarize_batch(articles: list[dict], max_tokens: int = 2048) -> tuple[bool
         return False, {}, {}
 
 
-def _clean_and_truncate(content: str, max_length: int = 3000) -> str:
+def _serialize_article(article: dict) -> str:
     """
-    Clean HTML and truncate content for LLM.
+    Serialize one article for the summary prompt.
 
     Args:
-        content: Raw HTML content
-        max_length: Maximum length
+        article: Article dict
 
     Returns:
-        Cleaned and truncated text
+        Compact JSON object with url, title and cleaned full_content
+    """
+    # Use full_content if available, else description
+    article_for_llm = {
+        "url": article.get("link", ""),
+        "title": article.get("title", ""),
+        "full_content": clean_and_truncate(
+            article.get("full_content") or article.get("description", "")
+        ),
+    }
+
+    # Compact JSON - indentation only adds input tokens
+    return json.dumps(article_for_llm, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_batch_messages(payloads: list[str]) -> list[dict]:
+    """
+    Build the chat messages for summarizing a batch of articles.
+
+    Args:
+        payloads: Serialized articles (from _serialize_article)
+
+    Returns:
+        List of chat messages (system + user)
+    """
+    # Load system prompt
+    system_prompt = load_prompt("generate_summary_system_prompt.md")
+
+    # Same shape as json.dumps({"articles": [...]}) with compact separators
+    user_message = '{"articles":[' + ",".join(payloads) + "]}"
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_message}
+    ]
+
+
+def _extract_summaries(result: dict) -> tuple[dict[str, str], dict[str, str]]:
     """
-    if not content:
-        return ""
+    Map a parsed LLM result to (summaries, titles) dicts keyed by URL.
 
-    # Remove HTML tags
-    text = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL)
-    text = re.sub(r'<[^>]+>', ' ', text)
+    Args:
+        result: Parsed LLM response with a 'summaries' list
 
-    # Decode entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
+    Returns:
+        Tuple of (summaries dict, titles dict)
+    """
+    summaries = {}
+    titles = {}
+    for item in result.get("summaries", []):
+        url = item.get("url", "")
+        summary = item.get("summary", "")
+        title = item.get("title", "")
+        if url and summary:
+            summaries[url] = summary
+        if url and title:
+            titles[url] = title
 
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    return summaries, titles
 
-    # Truncate
-    if len(text) > max_length:
-        text = text[:max_length] + "..."
 
-    return text
+def _parse_completed_items(response_text: str) -> dict:
+    """
+    Parse the complete items out of a truncated summaries response.
 
+    The response is cut off mid-item, so it isn't valid JSON as a whole, but
+    every item before the cut is a complete object in the 'summaries' array.
 
-def _parse_llm_response(response_text: str) -> dict:
-    """Parse LLM response, handling markdown code blocks."""
-    clean_text = response_text.strip()
+    Args:
+        response_text: Raw (truncated) LLM response
 
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
+    Returns:
+        Dict with a 'summaries' list of the fully received items
+    """
+    items: list[dict] = []
+    match = _SUMMARIES_ARRAY_RE.search(response_text)
+    if not match:
+        return {"summaries": items}
+
+    decoder = json.JSONDecoder()
+    pos = match.end()
+    while True:
+        pos = _ITEM_SEPARATOR_RE.match(response_text, pos).end()
+        try:
+            item, pos = decoder.raw_decode(response_text, pos)
+        except ValueError:
+            break  # End of the array, or the item cut off by the token limit
+        if not isinstance(item, dict):
+            break
+        items.append(item)
 
-    return json.loads(clean_text)
+    return {"summaries": items}
 
 
 def _retry_single_article(
@@ -374,52 +855,39 @@ def _retry_single_article(
         Tuple of (summary, title) or (None, None) if all retries fail
     """
     # Build a stronger prompt based on failure reason
-    extra_instruction = ""
-    if failure_reason == "too_long":
-        extra_instruction = """
-CRITICAL: Your previous summary was TOO LONG.
-You MUST output a summary under 200 characters (about 1-2 sentences).
-DO NOT copy the original text. SUMMARIZE it briefly."""
-    elif failure_reason == "not_korean":
-        extra_instruction = """
-CRITICAL: Your previous summary was in ENGLISH, not Korean.
-You MUST output the summary in Korean (한국어).
-Translate and summarize ALL content to Korean."""
-    elif failure_reason == "not_summarized":
-        extra_instruction = """
-CRITICAL: Your previous output was just the original content, not a summary.
-You MUST SUMMARIZE the content into 1-2 concise Korean sentences.
-DO NOT copy the original text verbatim."""
+    extra_instruction = RETRY_INSTRUCTIONS.get(failure_reason, "")
 
-    system_prompt = load_prompt("generate_summary_system_prompt.md")
-    system_prompt = f"{extra_instruction}\n\n{system_prompt}"
+    # Keep the system prompt first and unchanged so the retry shares the batch
+    # calls' cached prompt prefix; the stronger instruction follows it
+    messages = [{"role": "system", "content": load_prompt("generate_summary_system_prompt.md")}]
+    if extra_instruction:
+        messages.append({"role": "system", "content": extra_instruction})
 
     # Prepare single article
     article_for_llm = {
         "url": article.get("link", ""),
         "title": article.get("title", ""),
-        "full_content": _clean_and_truncate(
+        "full_content": clean_and_truncate(
             article.get("full_content") or article.get("description", ""),
             max_length=2000  # Shorter for single article
         ),
     }
 
-    user_message = json.dumps({"articles": [article_for_llm]}, indent=2)
+    user_message = json.dumps({"articles": [article_for_llm]}, ensure_ascii=False, separators=(",", ":"))
+    messages.append({"role": "user", "content": user_message})
     original_content = article.get("full_content") or article.get("description", "")
 
-    client = openai.OpenAI()
+    client = get_openai_client()
 
     for attempt in range(MAX_RETRIES):
         debug_log(f"[NODE: generate_summaries] Retry attempt {attempt + 1}/{MAX_RETRIES} for: {article.get('title', '')[:40]}...")
 
         try:
             response = client.chat.completions.create(
-                model="gpt-5-mini",
+                model=SUMMARY_MODEL,
                 max_completion_tokens=4096,  # Increased from 2048 - model needs ~2800 tokens for longer articles
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
+                messages=messages,
+                response_format=SUMMARY_RESPONSE_FORMAT,
             )
 
             track_llm_cost(
@@ -438,7 +906,7 @@ DO NOT copy the original text verbatim."""
                 debug_log(f"[NODE: generate_summaries] Retry {attempt + 1} returned empty content", "warning")
                 continue
 
-            result = _parse_llm_response(response_text)
+            result = parse_json_response(response_text)
 
             summaries = result.get("summaries", [])
             if summaries:
@@ -5,6 +5,7 @@ Uses LLM to confirm whether ambiguous article pairs (similarity 0.75-0.90)
 are true duplicates or unique articles.
 """
 
+import asyncio
 import json
 
 from dotenv import load_dotenv
@@ -13,10 +14,22 @@ import anthropic
 # Load environment variables
 load_dotenv()
 
-from src.utils import load_prompt
+from src.llm_cache import LLMCache
+from src.utils import batched, load_prompt
+from src.utils.json_parse import parse_json_response
 from src.tracking import track_llm_cost, debug_log, track_time
 
 
+CONFIRM_MODEL = "claude-haiku-4-5-20251001"
+
+
+# Pairs per LLM call - keeps each response well inside max_tokens
+PAIR_BATCH_SIZE = 20
+
+# Max batches in flight at once (well within Haiku rate limits)
+MAX_CONCURRENT_BATCHES = 8
+
+
 def llm_confirm_duplicates(state: dict) -> dict:
     """
     Use LLM to confirm ambiguous duplicate pairs.
@@ -51,32 +64,54 @@ def llm_confirm_duplicates(state: dict) -> dict:
                 "confirmed_unique": unique_articles
             }
 
-        # Batch all ambiguous pairs into single LLM call
-        pairs_for_llm = []
-        for i, pair in enumerate(ambiguous_pairs):
-            pairs_for_llm.append({
+        # Build LLM input for every ambiguous pair
+        pairs_for_llm = [
+            {
                 "pair_index": i,
-                "new_article": {
-                    "title": pair["new_article"].get("title", ""),
-                    "summary": pair["new_article"].get("contents", pair["new_article"].get("summary", "")),
-                    "source": pair["new_article"].get("source", ""),
-                    "date": pair["new_article"].get("date", pair["new_article"].get("pub_date", ""))
-                },
-                "existing_article": {
-                    "title": pair["existing_article"].get("title", ""),
-                    "summary": pair["existing_article"].get("summary", ""),
-                    "source": pair["existing_article"].get("source", ""),
-                    "date": pair["existing_article"].get("pub_date", "")
-                },
-                "similarity_score": pair["similarity"]
-            })
+                "new_article": _new_article_for_llm(pair["new_article"]),
+                "existing_article": _existing_article_for_llm(pair["existing_article"]),
+                "similarity_score": pair["similarity"],
+            }
+            for i, pair in enumerate(ambiguous_pairs)
+        ]
 
-        # Make LLM call
-        confirmations = _call_llm_for_confirmation(pairs_for_llm)
+        # Pairs already judged by a previous run are served from the cache
+        cache = LLMCache("llm_confirm_duplicates")
+        system_prompt = load_prompt("confirm_duplicate_system_prompt.md")
+        cache_keys = [_confirmation_cache_key(p, system_prompt) for p in pairs_for_llm]
+        cached = cache.get_many(cache_keys)
+
+        confirmations: dict[int, dict] = {}
+        to_call: list[dict] = []
+        for pair_for_llm, key in zip(pairs_for_llm, cache_keys):
+            if key in cached:
+                confirmations[pair_for_llm["pair_index"]] = cached[key]
+            else:
+                to_call.append(pair_for_llm)
+
+        debug_log(f"[NODE: llm_confirm_duplicates] Cache hits: {len(confirmations)}, LLM calls needed: {len(to_call)}")
+
+        # Confirm the rest in batches (concurrently)
+        if to_call:
+            batches = list(batched(to_call, PAIR_BATCH_SIZE))
+            new_confirmations = asyncio.run(_confirm_batches(batches))
+            confirmations.update(new_confirmations)
+
+            # Only answers the LLM actually gave are cached (not parse-error defaults)
+            cache.set_many({
+                cache_keys[pair_index]: {
+                    "is_duplicate": confirmation.get("is_duplicate", False),
+                    "reason": confirmation.get("reason", ""),
+                }
+                for pair_index, confirmation in new_confirmations.items()
+            })
 
         # Process results
-        for i, confirmation in enumerate(confirmations):
-            pair = ambiguous_pairs[i]
+        for i, pair in enumerate(ambiguous_pairs):
+            confirmation = confirmations.get(i, {
+                "is_duplicate": False,
+                "reason": "No LLM response - defaulting to unique"
+            })
 
             if confirmation.get("is_duplicate", False):
                 # Add to duplicates
@@ -110,29 +145,61 @@ def llm_confirm_duplicates(state: dict) -> dict:
         }
 
 
-def _call_llm_for_confirmation(pairs: list[dict]) -> list[dict]:
+async def _confirm_batches(batches: list[list[dict]]) -> dict[int, dict]:
+    """
+    Confirm all batches of pairs concurrently, at most MAX_CONCURRENT_BATCHES at a time.
+
+    Args:
+        batches: List of pair batches (pair dicts for LLM)
+
+    Returns:
+        Dict mapping pair_index to confirmation {is_duplicate, reason}.
+        Pairs without an LLM answer are absent (caller defaults them to unique).
+    """
+    client = anthropic.AsyncAnthropic()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def confirm(batch: list[dict]) -> dict[int, dict]:
+        async with semaphore:
+            return await _call_llm_for_confirmation(client, batch)
+
+    try:
+        results = await asyncio.gather(*(confirm(batch) for batch in batches))
+    finally:
+        await client.close()
+
+    confirmations: dict[int, dict] = {}
+    for batch_confirmations in results:
+        confirmations.update(batch_confirmations)
+
+    return confirmations
+
+
+async def _call_llm_for_confirmation(client: anthropic.AsyncAnthropic, pairs: list[dict]) -> dict[int, dict]:
     """
     Call LLM to confirm duplicate pairs.
 
     Args:
+        client: Shared async Anthropic client
         pairs: List of pair dicts for LLM
 
     Returns:
-        List of confirmation dicts with is_duplicate and reason
+        Dict mapping pair_index to confirmation {is_duplicate, reason},
+        for the pairs the LLM answered (empty on parse error)
     """
     # Load system prompt
     system_prompt = load_prompt("confirm_duplicate_system_prompt.md")
 
-    # Prepare user message
-    user_message = json.dumps({"pairs": pairs}, indent=2)
+    # Prepare user message - pairs are numbered 0..n-1 within the batch
+    # (as in the prompt example) and mapped back to global indexes below
+    batch_pairs = [{**pair, "pair_index": local_index} for local_index, pair in enumerate(pairs)]
+    user_message = json.dumps({"pairs": batch_pairs}, ensure_ascii=False, separators=(",", ":"))
 
     debug_log(f"[LLM INPUT]: Confirming {len(pairs)} ambiguous pairs")
 
     # Make LLM call
-    client = anthropic.Anthropic()
-
-    response = client.messages.create(
-        model="claude-haiku-4-5-20251001",
+    response = await client.messages.create(
+        model=CONFIRM_MODEL,
         max_tokens=2048,
         system=system_prompt,
         messages=[
@@ -153,46 +220,85 @@ def _call_llm_for_confirmation(pairs: list[dict]) -> list[dict]:
 
     # Parse JSON response
     try:
-        result = _parse_llm_response(response_text)
-        confirmations = result.get("confirmations", [])
-
-        # Ensure we have confirmation for each pair (default to not duplicate)
-        while len(confirmations) < len(pairs):
-            confirmations.append({
-                "pair_index": len(confirmations),
-                "is_duplicate": False,
-                "reason": "No LLM response - defaulting to unique"
-            })
-
-        return confirmations
+        result = parse_json_response(response_text)
+        by_local_index = _map_confirmations(result.get("confirmations", []), len(pairs))
+        return {pairs[local_index]["pair_index"]: c for local_index, c in by_local_index.items()}
 
     except Exception as e:
         debug_log(f"[NODE: llm_confirm_duplicates] ERROR parsing response: {e}", "error")
-        # Default all to unique on parse error
-        return [
-            {"pair_index": i, "is_duplicate": False, "reason": f"Parse error: {e}"}
-            for i in range(len(pairs))
-        ]
+        # Caller defaults every pair in this batch to unique
+        return {}
 
 
-def _parse_llm_response(response_text: str) -> dict:
+def _map_confirmations(confirmations: list[dict], pair_count: int) -> dict[int, dict]:
     """
-    Parse LLM response, handling markdown code blocks.
+    Map LLM confirmations to batch-local pair indexes.
+
+    Uses the echoed pair_index (coerced with int(), so "3" works) when every
+    answer carries a distinct index within 0..pair_count-1. Otherwise falls
+    back to positional order, as answers are given in request order.
 
     Args:
-        response_text: Raw LLM response
+        confirmations: 'confirmations' list from the LLM response
+        pair_count: Number of pairs sent in the batch
 
     Returns:
-        Parsed JSON dict
+        Dict mapping batch-local index to confirmation
+    """
+    try:
+        indexes = [int(c["pair_index"]) for c in confirmations]
+    except (KeyError, TypeError, ValueError):
+        indexes = None
+
+    if indexes is not None and len(set(indexes)) == len(indexes) and all(0 <= i < pair_count for i in indexes):
+        return dict(zip(indexes, confirmations))
+
+    debug_log(
+        "[NODE: llm_confirm_duplicates] Echoed pair_index values don't match the batch - "
+        "mapping answers by position",
+        "warning"
+    )
+    return dict(enumerate(confirmations[:pair_count]))
+
+
+def _new_article_for_llm(article: dict) -> dict:
+    """Prompt fields of the incoming article (pipeline format) in a pair."""
+    get = article.get
+    return {
+        "title": get("title", ""),
+        "summary": get("contents", get("summary", "")),
+        "source": get("source", ""),
+        "date": get("date", get("pub_date", "")),
+    }
+
+
+def _existing_article_for_llm(article: dict) -> dict:
+    """Prompt fields of the stored article (DB format) in a pair."""
+    get = article.get
+    return {
+        "title": get("title", ""),
+        "summary": get("summary", ""),
+        "source": get("source", ""),
+        "date": get("pub_date", ""),
+    }
+
+
+def _confirmation_cache_key(pair: dict, system_prompt: str) -> str:
     """
-    clean_text = response_text.strip()
+    Build the LLM cache key for a pair confirmation.
+
+    The similarity score is left out: it shifts with embedding changes while
+    the judgement depends on the two articles themselves.
 
-    # Remove markdown code blocks if present
-    if clean_text.startswith("```"):
-        lines = clean_text.split("\n")
-        lines = lines[1:]  # Remove first line with ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        clean_text = "\n".join(lines)
+    Args:
+        pair: Pair dict for LLM
+        system_prompt: Confirmation system prompt for the current config
 
-    return json.loads(clean_text)
+    Returns:
+        Cache key
+    """
+    return LLMCache.make_key(
+        CONFIRM_MODEL,
+        system_prompt,
+        json.dumps([pair["new_article"], pair["existing_article"]], ensure_ascii=False, sort_keys=True),
+    )
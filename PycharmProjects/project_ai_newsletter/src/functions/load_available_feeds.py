@@ -5,12 +5,41 @@ Reads the RSS availability results from Layer 1 and extracts
 available feeds for content aggregation.
 """
 
-import json
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils.json_parse import read_json_file
+
+
+# Host part of a source URL, without protocol and leading www.
+_HOST_RE = re.compile(r"^(?:https?://)?(?:www\.)?([^/]*)")
+# Common TLDs stripped from the host (co.kr before kr)
+_TLD_RE = re.compile(r"\.(?:com|eu|io|co\.kr|kr)")
+
+# Special-case display names, keyed by lowercased name without spaces
+_SOURCE_NAME_MAP = {
+    "techcrunch": "TechCrunch",
+    "venturebeat": "VentureBeat",
+    "kdnuggets": "KDnuggets",
+    "cbinsights": "CB Insights",
+    "aibusiness": "AI Business",
+    "inc42": "Inc42",
+    "36kr": "36Kr",
+    "ft": "Financial Times",
+    "bbc": "BBC",
+    "forbes": "Forbes",
+    "fortune": "Fortune",
+    "sifted": "Sifted",
+    "wamda": "Wamda",
+    "agbi": "AGBI",
+    "rfi": "RFI",
+    "itnewsafrica": "IT News Africa",
+    "analyticsindiamag": "Analytics India Mag",
+}
 
 
 class FeedInfo(TypedDict):
@@ -47,13 +76,13 @@ def load_available_feeds(state: dict) -> dict:
             debug_log("[NODE: load_available_feeds] ERROR: rss_availability.json not found", "error")
             return {"available_feeds": []}
 
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(data_path)
 
         debug_log(f"[NODE: load_available_feeds] Loaded {data.get('total', 0)} total sources")
 
         # Filter for available feeds only
         available_feeds: list[FeedInfo] = []
+        source_filter_lower = [f.lower() for f in source_filter] if source_filter else None
 
         for result in data.get("results", []):
             if result.get("status") != "available":
@@ -67,11 +96,11 @@ def load_available_feeds(state: dict) -> dict:
             source_name = _extract_source_name(result.get("url", ""))
 
             # Apply source filter if specified
-            if source_filter:
+            if source_filter_lower:
                 # Check if source matches any filter (case-insensitive)
                 source_lower = source_name.lower()
                 url_lower = result.get("url", "").lower()
-                if not any(f.lower() in source_lower or f.lower() in url_lower for f in source_filter):
+                if not any(f in source_lower or f in url_lower for f in source_filter_lower):
                     continue
 
             feed_info: FeedInfo = {
@@ -90,6 +119,7 @@ def load_available_feeds(state: dict) -> dict:
         return {"available_feeds": available_feeds}
 
 
+@lru_cache(maxsize=512)
 def _extract_source_name(url: str) -> str:
     """
     Extract a readable source name from URL.
@@ -101,16 +131,11 @@ def _extract_source_name(url: str) -> str:
     if not url:
         return "Unknown"
 
-    # Remove protocol and www
-    name = url.replace("https://", "").replace("http://", "")
-    name = name.replace("www.", "")
-
-    # Get the domain part
-    name = name.split("/")[0]
+    # Get the domain part (without protocol and www)
+    name = _HOST_RE.match(url).group(1).replace("www.", "")
 
     # Remove common TLDs
-    name = name.replace(".com", "").replace(".eu", "").replace(".io", "")
-    name = name.replace(".co.kr", "").replace(".kr", "")
+    name = _TLD_RE.sub("", name)
 
     # Handle subdomains
     if "." in name:
@@ -124,29 +149,8 @@ def _extract_source_name(url: str) -> str:
     # Title case and clean up
     name = name.replace("-", " ").replace("_", " ")
 
-    # Special cases
-    name_map = {
-        "techcrunch": "TechCrunch",
-        "venturebeat": "VentureBeat",
-        "kdnuggets": "KDnuggets",
-        "cbinsights": "CB Insights",
-        "aibusiness": "AI Business",
-        "inc42": "Inc42",
-        "36kr": "36Kr",
-        "ft": "Financial Times",
-        "bbc": "BBC",
-        "forbes": "Forbes",
-        "fortune": "Fortune",
-        "sifted": "Sifted",
-        "wamda": "Wamda",
-        "agbi": "AGBI",
-        "rfi": "RFI",
-        "itnewsafrica": "IT News Africa",
-        "analyticsindiamag": "Analytics India Mag",
-    }
-
     lower_name = name.lower().replace(" ", "")
-    if lower_name in name_map:
-        return name_map[lower_name]
+    if lower_name in _SOURCE_NAME_MAP:
+        return _SOURCE_NAME_MAP[lower_name]
 
     return name.title()
@@ -6,11 +6,14 @@ Used by Layer 2 to skip inactive/error accounts.
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import TypedDict, Optional
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils import matches_filter
+from src.utils.json_parse import read_json_file
 
 
 def _get_availability_file() -> Path:
@@ -26,6 +29,34 @@ class AvailableAccountInfo(TypedDict):
     last_tweet_date: Optional[str]
 
 
+def _keep(result: dict, handle_filter_lower: list[str] | None, skipped: dict[str, list[str]]) -> bool:
+    """
+    Decide whether an L1 result is loaded, recording the reason if not.
+
+    Args:
+        result: Entry from twitter_availability.json results
+        handle_filter_lower: Lowercased handle filter, or None
+        skipped: reason -> handles, appended to for skipped results
+
+    Returns:
+        True if the account is active and matches the handle filter
+    """
+    handle = result.get("handle", "")
+    status = result.get("status", "")
+
+    # Skip non-active accounts
+    if status != "active":
+        skipped[status].append(handle)
+        return False
+
+    # Apply handle filter if provided
+    if not matches_filter(handle, handle_filter_lower):
+        skipped["not in filter"].append(handle)
+        return False
+
+    return True
+
+
 def load_available_twitter_accounts(state: dict) -> dict:
     """
     Load accounts marked as 'active' from twitter_availability.json.
@@ -58,8 +89,7 @@ def load_available_twitter_accounts(state: dict) -> dict:
 
         # Load availability data
         try:
-            with open(availability_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(availability_file)
         except (json.JSONDecodeError, IOError) as e:
             debug_log(
                 f"[NODE: load_available_twitter_accounts] Error reading file: {e}",
@@ -76,35 +106,25 @@ def load_available_twitter_accounts(state: dict) -> dict:
         debug_log(f"[NODE: load_available_twitter_accounts] Loaded {len(results)} accounts from L1")
 
         # Filter for active accounts only
-        available_accounts: list[AvailableAccountInfo] = []
-
-        for result in results:
-            handle = result.get("handle", "")
-            status = result.get("status", "")
-
-            # Skip non-active accounts
-            if status != "active":
-                debug_log(
-                    f"[NODE: load_available_twitter_accounts] Skipping {handle}: {status}"
-                )
-                continue
-
-            # Apply handle filter if provided
-            if handle_filter:
-                if not any(f.lower() in handle.lower() for f in handle_filter):
-                    debug_log(
-                        f"[NODE: load_available_twitter_accounts] "
-                        f"Skipping {handle}: not in filter"
-                    )
-                    continue
-
-            account_info: AvailableAccountInfo = {
-                "handle": handle,
+        handle_filter_lower = [f.lower() for f in handle_filter] if handle_filter else None
+        skipped: dict[str, list[str]] = defaultdict(list)  # reason -> handles
+        available_accounts: list[AvailableAccountInfo] = [
+            {
+                "handle": result.get("handle", ""),
                 "category": result.get("category", "unknown"),
-                "status": status,
+                "status": "active",
                 "last_tweet_date": result.get("last_tweet_date"),
             }
-            available_accounts.append(account_info)
+            for result in results
+            if _keep(result, handle_filter_lower, skipped)
+        ]
+
+        # One line per skip reason rather than one per account
+        for reason, handles in skipped.items():
+            debug_log(
+                f"[NODE: load_available_twitter_accounts] "
+                f"Skipping {len(handles)} ({reason}): {', '.join(handles)}"
+            )
 
         debug_log(
             f"[NODE: load_available_twitter_accounts] "
@@ -112,10 +132,10 @@ def load_available_twitter_accounts(state: dict) -> dict:
         )
 
         # Log which accounts are available
-        for acc in available_accounts:
+        if available_accounts:
             debug_log(
-                f"[NODE: load_available_twitter_accounts] "
-                f"  - {acc['handle']} ({acc['category']})"
+                f"[NODE: load_available_twitter_accounts] Available: "
+                + ", ".join(f"{acc['handle']} ({acc['category']})" for acc in available_accounts)
             )
 
         return {
@@ -5,12 +5,13 @@ Loads enabled sources from config.json["browser_use_sources"] for
 browser-use Agent-based content scraping.
 """
 
-import json
 from pathlib import Path
 from typing import TypedDict, Optional
 
-from src.config import get_config_path
+from src.config import get_config_path, read_config_json
 from src.tracking import debug_log, track_time
+from src.utils import matches_filter
+from src.utils.source_name import extract_source_name
 
 
 class BrowserUseSource(TypedDict):
@@ -27,6 +28,11 @@ class BrowserUseSettings(TypedDict):
     model: str
 
 
+def _source_name(source: dict) -> str:
+    """Configured display name, or one derived from the source URL."""
+    return source["name"] if "name" in source else extract_source_name(source.get("url", ""))
+
+
 def load_browser_use_sources(state: dict) -> dict:
     """
     Load enabled browser-use sources from config.json.
@@ -50,8 +56,7 @@ def load_browser_use_sources(state: dict) -> dict:
             debug_log("[NODE: load_browser_use_sources] config.json not found", "error")
             return {"browser_use_sources": [], "browser_use_settings": {}}
 
-        with open(config_file) as f:
-            config_data = json.load(f)
+        config_data = read_config_json(config_file)
 
         # Get browser_use_sources
         all_sources = config_data.get("browser_use_sources", [])
@@ -65,62 +70,28 @@ def load_browser_use_sources(state: dict) -> dict:
             model=settings.get("model", "claude-sonnet-4-20250514"),
         )
 
-        # Filter to enabled sources
-        enabled_sources: list[BrowserUseSource] = []
-
-        for source in all_sources:
-            url = source.get("url", "")
-            enabled = source.get("enabled", False)
-            name = source.get("name", _extract_source_name(url))
-
-            if not enabled:
-                debug_log(f"[NODE: load_browser_use_sources] Skipping disabled: {name}")
-                continue
-
-            # Apply optional URL filter
-            if url_filter:
-                if not any(f.lower() in url.lower() for f in url_filter):
-                    continue
-
-            enabled_sources.append(BrowserUseSource(
-                url=url,
-                name=name,
-                enabled=enabled,
-            ))
-
+        # Filter to enabled sources (applying optional URL filter)
+        url_filter_lower = [f.lower() for f in url_filter] if url_filter else None
+        disabled = [_source_name(source) for source in all_sources if not source.get("enabled", False)]
+        enabled_sources: list[BrowserUseSource] = [
+            BrowserUseSource(
+                url=source.get("url", ""),
+                name=_source_name(source),
+                enabled=source["enabled"],
+            )
+            for source in all_sources
+            if source.get("enabled", False) and matches_filter(source.get("url", ""), url_filter_lower)
+        ]
+
+        if disabled:
+            debug_log(f"[NODE: load_browser_use_sources] Skipping {len(disabled)} disabled: {', '.join(disabled)}")
         debug_log(f"[NODE: load_browser_use_sources] Enabled sources: {len(enabled_sources)}")
-        for source in enabled_sources:
-            debug_log(f"[NODE: load_browser_use_sources]   - {source['name']} ({source['url']})")
+        if enabled_sources:
+            debug_log("[NODE: load_browser_use_sources] Enabled: " + ", ".join(
+                f"{source['name']} ({source['url']})" for source in enabled_sources
+            ))
 
         return {
             "browser_use_sources": enabled_sources,
             "browser_use_settings": browser_use_settings,
         }
-
-
-def _extract_source_name(url: str) -> str:
-    """
-    Extract a readable source name from URL.
-
-    Args:
-        url: Full URL of the source
-
-    Returns:
-        Human-readable source name
-    """
-    # Remove protocol
-    name = url.replace("https://", "").replace("http://", "")
-
-    # Remove www.
-    name = name.replace("www.", "")
-
-    # Remove trailing slash and path
-    name = name.split("/")[0]
-
-    # Remove .com, .ai, etc. for cleaner name
-    parts = name.split(".")
-    if len(parts) >= 2:
-        # Use first part as name, capitalize
-        name = parts[0].replace("-", " ").replace("_", " ").title()
-
-    return name
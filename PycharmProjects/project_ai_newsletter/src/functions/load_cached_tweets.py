@@ -10,12 +10,16 @@ Supports both:
 """
 
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
-from src.config import get_data_dir, get_shared_twitter_cache_path, get_twitter_accounts_path
+from src.config import get_data_dir, get_shared_twitter_cache_path, get_twitter_accounts_path, read_config_json
 from src.tracking import debug_log, track_time
+from src.utils.json_parse import read_json_file
 
 
 def _get_cache_file() -> Path:
@@ -42,8 +46,7 @@ def _get_config_handles() -> set[str]:
         return set()
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_config_json(config_path)
     except (json.JSONDecodeError, IOError) as e:
         debug_log(f"[_get_config_handles] Error reading {config_path}: {e}", "error")
         return set()
@@ -94,7 +97,7 @@ def load_cached_tweets(state: dict) -> dict:
             )
         else:
             # Default: use handles from available_accounts (L1 output)
-            available_handles = {acc["handle"] for acc in available_accounts}
+            available_handles = set(map(itemgetter("handle"), available_accounts))
 
         debug_log(f"[NODE: load_cached_tweets] Loading tweets for {len(available_handles)} accounts")
 
@@ -116,8 +119,7 @@ def load_cached_tweets(state: dict) -> dict:
 
         # Load cache data
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            cache_data = read_json_file(cache_file)
         except (json.JSONDecodeError, IOError) as e:
             debug_log(f"[NODE: load_cached_tweets] Error reading cache: {e}", "error")
             return {"raw_tweets": []}
@@ -131,23 +133,22 @@ def load_cached_tweets(state: dict) -> dict:
 
         # Extract tweets for available accounts only
         accounts_data = cache_data.get("accounts", {})
-        raw_tweets: list[dict] = []
+        hits = [handle for handle in available_handles if accounts_data.get(handle)]
+        misses = available_handles.difference(hits)
 
-        for handle in available_handles:
-            account_cache = accounts_data.get(handle)
-
-            if not account_cache:
-                debug_log(
-                    f"[NODE: load_cached_tweets] No cache for {handle}",
-                    "warning"
-                )
-                continue
+        if misses:
+            debug_log(
+                f"[NODE: load_cached_tweets] No cache for {len(misses)} handles: {', '.join(sorted(misses))}",
+                "warning"
+            )
 
-            tweets = account_cache.get("tweets", [])
-            raw_tweets.extend(tweets)
+        tweets_by_handle = {handle: accounts_data[handle].get("tweets", []) for handle in hits}
+        raw_tweets: list[dict] = list(chain.from_iterable(tweets_by_handle.values()))
 
+        if tweets_by_handle:
             debug_log(
-                f"[NODE: load_cached_tweets] Loaded {len(tweets)} tweets for {handle}"
+                f"[NODE: load_cached_tweets] Loaded tweets per handle: "
+                + ", ".join(f"{handle}={len(tweets)}" for handle, tweets in tweets_by_handle.items())
             )
 
         debug_log(f"[NODE: load_cached_tweets] Output: {len(raw_tweets)} total tweets")
@@ -164,13 +165,10 @@ def _check_cache_freshness(timestamp_str: str, ttl_hours: int) -> None:
         ttl_hours: Cache time-to-live in hours
     """
     try:
-        # Parse ISO timestamp (handle both with and without Z suffix)
-        ts = timestamp_str.rstrip("Z")
-        cache_time = datetime.fromisoformat(ts)
-        now = datetime.now()
-
-        age = now - cache_time
-        age_hours = age.total_seconds() / 3600
+        # The savers write local time, some with a "Z" suffix - drop it so the
+        # timestamp is read as local time rather than UTC
+        cache_epoch = datetime.fromisoformat(timestamp_str.removesuffix("Z")).timestamp()
+        age_hours = (time.time() - cache_epoch) / 3600
 
         if age_hours > ttl_hours:
             debug_log(
@@ -5,7 +5,10 @@ Loads articles from the last N hours from the SQLite database
 for semantic similarity comparison.
 """
 
+import numpy as np
+
 from src.database import ArticleDatabase
+from src.functions.generate_embeddings import EMBEDDING_DIMENSIONS
 from src.tracking import debug_log, track_time
 
 
@@ -21,7 +24,9 @@ def load_historical_embeddings(state: dict) -> dict:
 
     Returns:
         Dict with:
-        - 'historical_articles': List of articles with embeddings
+        - 'historical_articles': List of article dicts (without embeddings)
+        - 'historical_embeddings': float32 matrix (n_articles, EMBEDDING_DIMENSIONS);
+          row i embeds historical_articles[i]
         - 'is_first_run': True if database is empty
     """
     with track_time("load_historical_embeddings"):
@@ -37,20 +42,26 @@ def load_historical_embeddings(state: dict) -> dict:
             debug_log("[NODE: load_historical_embeddings] Database empty (first run)")
             return {
                 "historical_articles": [],
+                "historical_embeddings": np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32),
                 "is_first_run": True
             }
 
-        # Load recent articles with embeddings
-        historical_articles = db.get_recent_articles(
+        # Load recent articles with embeddings (articles without one are skipped in SQL)
+        articles_with_embeddings = db.get_recent_articles(
             hours=lookback_hours,
-            with_embeddings=True
+            with_embeddings=True,
+            require_embedding=True
         )
 
-        # Filter out articles without embeddings
-        articles_with_embeddings = [
-            article for article in historical_articles
-            if article.get("embedding") is not None
-        ]
+        # Stack embeddings into one matrix so similarity is a single matmul;
+        # the article dicts keep only metadata.
+        # Articles stored before the switch to reduced dimensions hold full
+        # 1536-dim vectors. Their leading EMBEDDING_DIMENSIONS components are
+        # equivalent (up to scale) to a reduced embedding, and cosine
+        # similarity ignores scale, so truncating keeps them comparable.
+        embeddings = np.empty((len(articles_with_embeddings), EMBEDDING_DIMENSIONS), dtype=np.float32)
+        for row, article in enumerate(articles_with_embeddings):
+            embeddings[row] = article.pop("embedding")[:EMBEDDING_DIMENSIONS]
 
         debug_log(
             f"[NODE: load_historical_embeddings] Loaded {len(articles_with_embeddings)} "
@@ -59,5 +70,6 @@ def load_historical_embeddings(state: dict) -> dict:
 
         return {
             "historical_articles": articles_with_embeddings,
+            "historical_embeddings": embeddings,
             "is_first_run": False
         }
@@ -5,11 +5,11 @@ Loads raw articles from cache file for LLM processing.
 Used when running content_orchestrator with --from-cache flag.
 """
 
-import json
 from pathlib import Path
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils.json_parse import read_json_file
 
 
 def load_rss_cache(state: dict) -> dict:
@@ -33,8 +33,7 @@ def load_rss_cache(state: dict) -> dict:
             return {"raw_articles": []}
 
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            cache_data = read_json_file(cache_path)
         except Exception as e:
             debug_log(f"[NODE: load_rss_cache] Error loading cache: {e}", "error")
             return {"raw_articles": []}
@@ -44,12 +43,13 @@ def load_rss_cache(state: dict) -> dict:
 
         # Apply source filter if provided
         if source_filter:
+            source_filter_lower = [f.lower() for f in source_filter]
             filtered = []
             for article in articles:
                 source_name = article.get("source_name", "").lower()
                 feed_url = article.get("feed_url", "").lower()
 
-                if any(f.lower() in source_name or f.lower() in feed_url for f in source_filter):
+                if any(f in source_name or f in feed_url for f in source_filter_lower):
                     filtered.append(article)
 
             debug_log(f"[NODE: load_rss_cache] After source filter: {len(filtered)} articles")
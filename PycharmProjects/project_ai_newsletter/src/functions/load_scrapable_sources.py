@@ -5,12 +5,15 @@ Loads sources marked as "scrapable" with full config from html_availability.json
 for HTML Layer 2 content scraping.
 """
 
-import json
+from collections import defaultdict
 from pathlib import Path
 from typing import TypedDict, Optional
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils import matches_filter
+from src.utils.source_name import extract_source_name
+from src.utils.json_parse import read_json_file
 
 
 class ScrapableSource(TypedDict):
@@ -28,6 +31,55 @@ class ScrapableSource(TypedDict):
     confidence: float
 
 
+def _has_full_config(source: dict, skipped_partial: dict[str, list[str]]) -> bool:
+    """
+    Check a scrapable source for listing_page and article_page configs.
+
+    Args:
+        source: Entry from html_availability.json results
+        skipped_partial: reason -> URLs, appended to for incomplete sources
+
+    Returns:
+        True if both configs and the required selectors are present
+    """
+    listing_page = source.get("listing_page")
+    article_page = source.get("article_page")
+
+    if not listing_page:
+        reason = "no listing_page config"
+    elif not article_page:
+        reason = "no article_page config"
+    elif not article_page.get("title_selector") or not article_page.get("content_selector"):
+        reason = "missing required selectors"
+    else:
+        return True
+
+    skipped_partial[reason].append(source.get("url", ""))
+    return False
+
+
+def _to_scrapable_source(source: dict) -> ScrapableSource:
+    """Build a ScrapableSource from a fully configured html_availability entry."""
+    url = source.get("url", "")
+    listing_page = source["listing_page"]
+    article_page = source["article_page"]
+    recommendation = source.get("recommendation", {})
+
+    return ScrapableSource(
+        url=url,
+        source_name=extract_source_name(url),
+        article_url_pattern=listing_page.get("article_url_pattern", ""),
+        sample_urls=listing_page.get("sample_urls", []),
+        title_selector=article_page.get("title_selector", ""),
+        content_selector=article_page.get("content_selector", ""),
+        date_selector=article_page.get("date_selector"),
+        date_format=article_page.get("date_format"),
+        author_selector=article_page.get("author_selector"),
+        approach=recommendation.get("approach", "http_simple"),
+        confidence=recommendation.get("confidence", 0.0),
+    )
+
+
 def load_scrapable_sources(state: dict) -> dict:
     """
     Load sources marked as "scrapable" with full config from html_availability.json.
@@ -51,100 +103,32 @@ def load_scrapable_sources(state: dict) -> dict:
             debug_log("[NODE: load_scrapable_sources] html_availability.json not found", "error")
             return {"scrapable_sources": []}
 
-        with open(html_file) as f:
-            html_data = json.load(f)
+        html_data = read_json_file(html_file)
 
         results = html_data.get("results", [])
         debug_log(f"[NODE: load_scrapable_sources] Loaded {len(results)} total sources")
 
         # Filter to scrapable with full config
-        scrapable_sources: list[ScrapableSource] = []
-        skipped_partial = 0
-
-        for source in results:
-            url = source.get("url", "")
-            status = source.get("status", "")
-
-            # Must be scrapable
-            if status != "scrapable":
-                continue
-
-            # Must have listing_page config
-            listing_page = source.get("listing_page")
-            if not listing_page:
-                debug_log(f"[NODE: load_scrapable_sources] Skipping {url} - no listing_page config")
-                skipped_partial += 1
-                continue
-
-            # Must have article_page config
-            article_page = source.get("article_page")
-            if not article_page:
-                debug_log(f"[NODE: load_scrapable_sources] Skipping {url} - no article_page config")
-                skipped_partial += 1
-                continue
-
-            # Must have required selectors
-            if not article_page.get("title_selector") or not article_page.get("content_selector"):
-                debug_log(f"[NODE: load_scrapable_sources] Skipping {url} - missing required selectors")
-                skipped_partial += 1
-                continue
-
-            # Apply optional URL filter
-            if url_filter:
-                if not any(f.lower() in url.lower() for f in url_filter):
-                    continue
-
-            # Extract source name from URL
-            source_name = _extract_source_name(url)
-
-            recommendation = source.get("recommendation", {})
-
-            scrapable_sources.append(ScrapableSource(
-                url=url,
-                source_name=source_name,
-                article_url_pattern=listing_page.get("article_url_pattern", ""),
-                sample_urls=listing_page.get("sample_urls", []),
-                title_selector=article_page.get("title_selector", ""),
-                content_selector=article_page.get("content_selector", ""),
-                date_selector=article_page.get("date_selector"),
-                date_format=article_page.get("date_format"),
-                author_selector=article_page.get("author_selector"),
-                approach=recommendation.get("approach", "http_simple"),
-                confidence=recommendation.get("confidence", 0.0),
-            ))
-
-        debug_log(f"[NODE: load_scrapable_sources] Skipped {skipped_partial} sources with partial config")
+        url_filter_lower = [f.lower() for f in url_filter] if url_filter else None
+        skipped_partial: dict[str, list[str]] = defaultdict(list)  # reason -> URLs
+        scrapable_sources: list[ScrapableSource] = [
+            _to_scrapable_source(source)
+            for source in results
+            if source.get("status") == "scrapable"
+            and _has_full_config(source, skipped_partial)
+            and matches_filter(source.get("url", ""), url_filter_lower)
+        ]
+
+        if skipped_partial:
+            for reason, urls in skipped_partial.items():
+                debug_log(f"[NODE: load_scrapable_sources] Skipping {len(urls)} ({reason}): {', '.join(urls)}")
+            debug_log(f"[NODE: load_scrapable_sources] Skipped {sum(map(len, skipped_partial.values()))} sources with partial config")
         debug_log(f"[NODE: load_scrapable_sources] Scrapable sources with full config: {len(scrapable_sources)}")
 
-        for source in scrapable_sources:
-            debug_log(f"[NODE: load_scrapable_sources]   - {source['source_name']} ({source['url']}) confidence={source['confidence']}")
+        if scrapable_sources:
+            debug_log("[NODE: load_scrapable_sources] Scrapable: " + ", ".join(
+                f"{source['source_name']} ({source['url']}) confidence={source['confidence']}"
+                for source in scrapable_sources
+            ))
 
         return {"scrapable_sources": scrapable_sources}
-
-
-def _extract_source_name(url: str) -> str:
-    """
-    Extract a readable source name from URL.
-
-    Args:
-        url: Full URL of the source
-
-    Returns:
-        Human-readable source name
-    """
-    # Remove protocol
-    name = url.replace("https://", "").replace("http://", "")
-
-    # Remove www.
-    name = name.replace("www.", "")
-
-    # Remove trailing slash and path
-    name = name.split("/")[0]
-
-    # Remove .com, .ai, etc. for cleaner name
-    parts = name.split(".")
-    if len(parts) >= 2:
-        # Use first part as name, capitalize
-        name = parts[0].replace("-", " ").replace("_", " ").title()
-
-    return name
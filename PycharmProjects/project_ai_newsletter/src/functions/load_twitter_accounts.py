@@ -9,8 +9,9 @@ import json
 from pathlib import Path
 from typing import TypedDict
 
-from src.config import get_twitter_accounts_path, CONFIGS_DIR
+from src.config import get_twitter_accounts_path, CONFIGS_DIR, read_config_json
 from src.tracking import debug_log, track_time
+from src.utils import matches_filter
 
 
 class TwitterAccountInfo(TypedDict):
@@ -49,40 +50,27 @@ def load_twitter_accounts(state: dict) -> dict:
             debug_log("[NODE: load_twitter_accounts] ERROR: twitter_accounts.json not found", "error")
             return {"twitter_accounts": [], "twitter_settings": {}}
 
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_config_json(data_path)
 
         debug_log(f"[NODE: load_twitter_accounts] Loaded {len(data.get('accounts', []))} accounts")
 
         # Extract settings
-        settings: TwitterSettings = data.get("settings", {
+        settings: TwitterSettings = dict(data.get("settings", {
             "scrape_delay_seconds": 30,
             "max_age_hours": 24,
-        })
+        }))
 
-        # Filter accounts
-        twitter_accounts: list[TwitterAccountInfo] = []
-
-        for account in data.get("accounts", []):
-            handle = account.get("handle", "")
-            if not handle:
-                continue
-
-            # Apply handle filter if specified
-            if handle_filter:
-                # Check if handle matches any filter (case-insensitive)
-                handle_lower = handle.lower()
-                if not any(f.lower() in handle_lower for f in handle_filter):
-                    continue
-
-            account_info: TwitterAccountInfo = {
-                "handle": handle,
-                "category": account.get("category", ""),
-            }
-            twitter_accounts.append(account_info)
+        # Filter accounts (skip empty handles, apply handle filter if specified)
+        handle_filter_lower = [f.lower() for f in handle_filter] if handle_filter else None
+        twitter_accounts: list[TwitterAccountInfo] = [
+            {"handle": handle, "category": account.get("category", "")}
+            for account in data.get("accounts", [])
+            if (handle := account.get("handle", "")) and matches_filter(handle, handle_filter_lower)
+        ]
 
         debug_log(f"[NODE: load_twitter_accounts] Found {len(twitter_accounts)} accounts to scrape")
-        debug_log(f"[NODE: load_twitter_accounts] Output: {[a['handle'] for a in twitter_accounts]}")
+        if twitter_accounts:
+            debug_log(f"[NODE: load_twitter_accounts] Output: {[a['handle'] for a in twitter_accounts]}")
 
         return {
             "twitter_accounts": twitter_accounts,
@@ -118,6 +106,7 @@ def load_multi_config_twitter_accounts(
 
     deduped_accounts: list[TwitterAccountInfo] = []
     seen_handles: set[str] = set()
+    handle_filter_lower = [f.lower() for f in handle_filter] if handle_filter else None
     config_handle_map: dict[str, set[str]] = {}
 
     # Collect all scrape delays to use most conservative
@@ -137,8 +126,7 @@ def load_multi_config_twitter_accounts(
             continue
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_config_json(config_path)
         except (json.JSONDecodeError, IOError) as e:
             debug_log(
                 f"[load_multi_config_twitter_accounts] Error reading {config_path}: {e}",
@@ -158,6 +146,8 @@ def load_multi_config_twitter_accounts(
 
         # Process accounts
         config_handles: set[str] = set()
+        added_handles: list[str] = []
+        duplicate_handles: list[str] = []
         accounts = data.get("accounts", [])
 
         for account in accounts:
@@ -170,10 +160,8 @@ def load_multi_config_twitter_accounts(
                 handle = f"@{handle}"
 
             # Apply handle filter if specified
-            if handle_filter:
-                handle_lower = handle.lower()
-                if not any(f.lower() in handle_lower for f in handle_filter):
-                    continue
+            if not matches_filter(handle, handle_filter_lower):
+                continue
 
             # Track handle for this config
             config_handles.add(handle)
@@ -186,14 +174,20 @@ def load_multi_config_twitter_accounts(
                     "category": account.get("category", ""),
                 }
                 deduped_accounts.append(account_info)
-                debug_log(
-                    f"[load_multi_config_twitter_accounts] Added {handle} from {config_name}"
-                )
+                added_handles.append(handle)
             else:
-                debug_log(
-                    f"[load_multi_config_twitter_accounts] Skipping duplicate {handle} "
-                    f"(already added from earlier config)"
-                )
+                duplicate_handles.append(handle)
+
+        if added_handles:
+            debug_log(
+                f"[load_multi_config_twitter_accounts] Added from {config_name}: "
+                f"{', '.join(added_handles)}"
+            )
+        if duplicate_handles:
+            debug_log(
+                f"[load_multi_config_twitter_accounts] Skipping duplicates "
+                f"(already added from earlier config): {', '.join(duplicate_handles)}"
+            )
 
         config_handle_map[config_name] = config_handles
         debug_log(
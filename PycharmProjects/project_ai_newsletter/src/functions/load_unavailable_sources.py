@@ -6,12 +6,16 @@ for HTML scraping analysis.
 """
 
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TypedDict
+from urllib.parse import urlsplit
 
 from src.config import get_data_dir, load_config_settings
 from src.tracking import debug_log, track_time
+from src.utils import matches_filter
+from src.utils.json_parse import read_json_file
 
 
 class SourceInfo(TypedDict):
@@ -20,6 +24,23 @@ class SourceInfo(TypedDict):
     notes: str | None
 
 
+def _is_excluded(url: str, excluded_domains: frozenset[str], excluded_suffixes: tuple[str, ...]) -> bool:
+    """
+    Check whether a URL's host is an excluded domain or one of its subdomains.
+
+    URLs without a parseable host (no scheme, malformed brackets) fall back
+    to a substring match against the excluded domains.
+    """
+    url_lower = url.lower()
+    try:
+        host = urlsplit(url_lower).hostname or ""
+    except ValueError:
+        host = ""
+    if not host:
+        return any(domain in url_lower for domain in excluded_domains)
+    return host in excluded_domains or host.endswith(excluded_suffixes)
+
+
 def filter_recently_checked_html(urls: list[str], refresh_days: int) -> tuple[list[str], list[str]]:
     """
     Filter out URLs that were checked within the refresh period.
@@ -38,26 +59,26 @@ def filter_recently_checked_html(urls: list[str], refresh_days: int) -> tuple[li
         return urls, []
 
     try:
-        with open(output_path, "r") as f:
-            existing_data = json.load(f)
+        existing_data = read_json_file(output_path)
         existing_results = existing_data.get("results", [])
     except (json.JSONDecodeError, KeyError):
         debug_log("[filter_recently_checked_html] Could not parse existing results, processing all URLs")
         return urls, []
 
     # Build lookup map of URL -> analyzed_at timestamp
-    analyzed_at_map = {}
-    for result in existing_results:
-        url = result.get("url")
-        analyzed_at = result.get("analyzed_at")
-        if url:
-            analyzed_at_map[url] = analyzed_at
+    analyzed_at_map = {
+        result["url"]: result.get("analyzed_at")
+        for result in existing_results
+        if result.get("url")
+    }
 
     # Calculate cutoff date
-    cutoff_date = datetime.now() - timedelta(days=refresh_days)
+    now = datetime.now()
+    cutoff_date = now - timedelta(days=refresh_days)
 
     urls_to_process = []
     skipped_urls = []
+    decisions: dict[str, list[str]] = defaultdict(list)  # decision -> "url (detail)"
 
     for url in urls:
         analyzed_at_str = analyzed_at_map.get(url)
@@ -65,24 +86,27 @@ def filter_recently_checked_html(urls: list[str], refresh_days: int) -> tuple[li
         if analyzed_at_str is None:
             # New URL or entry without analyzed_at, needs processing
             urls_to_process.append(url)
-            debug_log(f"[filter_recently_checked_html] {url}: PROCESS (new or no timestamp)")
+            decisions["PROCESS (new or no timestamp)"].append(url)
         else:
             try:
                 analyzed_at_dt = datetime.fromisoformat(analyzed_at_str)
+                days_ago = (now - analyzed_at_dt).days
                 if analyzed_at_dt < cutoff_date:
                     # Stale entry, needs re-check
                     urls_to_process.append(url)
-                    days_ago = (datetime.now() - analyzed_at_dt).days
-                    debug_log(f"[filter_recently_checked_html] {url}: PROCESS (stale, {days_ago} days ago)")
+                    decisions["PROCESS (stale)"].append(f"{url} ({days_ago}d ago)")
                 else:
                     # Recently checked, skip
                     skipped_urls.append(url)
-                    days_ago = (datetime.now() - analyzed_at_dt).days
-                    debug_log(f"[filter_recently_checked_html] {url}: SKIP (fresh, {days_ago} days ago)")
+                    decisions["SKIP (fresh)"].append(f"{url} ({days_ago}d ago)")
             except ValueError:
                 # Invalid date format, re-check
                 urls_to_process.append(url)
-                debug_log(f"[filter_recently_checked_html] {url}: PROCESS (invalid timestamp)")
+                decisions["PROCESS (invalid timestamp)"].append(url)
+
+    # One line per decision rather than one per URL
+    for decision, entries in decisions.items():
+        debug_log(f"[filter_recently_checked_html] {decision}: {len(entries)} - {', '.join(entries)}")
 
     return urls_to_process, skipped_urls
 
@@ -110,7 +134,9 @@ def load_unavailable_sources(state: dict) -> dict:
         # Load exclusions from config
         config_settings = load_config_settings()
         html_exclusions = config_settings.get("html_exclusions", [])
-        excluded_domains = [e["domain"] for e in html_exclusions]
+        excluded_domains = frozenset(e["domain"].lower() for e in html_exclusions)
+        # Suffixes for matching subdomains (news.example.com excluded by example.com)
+        excluded_suffixes = tuple("." + d for d in excluded_domains)
         debug_log(f"[NODE: load_unavailable_sources] Loaded {len(excluded_domains)} exclusions from config")
 
         # Load rss_availability.json
@@ -119,8 +145,7 @@ def load_unavailable_sources(state: dict) -> dict:
             debug_log("[NODE: load_unavailable_sources] rss_availability.json not found", "error")
             return {"sources_to_test": [], "skipped_urls": []}
 
-        with open(rss_file) as f:
-            rss_data = json.load(f)
+        rss_data = read_json_file(rss_file)
 
         results = rss_data.get("results", [])
         debug_log(f"[NODE: load_unavailable_sources] Loaded {len(results)} total sources")
@@ -129,31 +154,26 @@ def load_unavailable_sources(state: dict) -> dict:
         unavailable = [r for r in results if r.get("status") == "unavailable"]
         debug_log(f"[NODE: load_unavailable_sources] Found {len(unavailable)} unavailable sources")
 
-        # Apply exclusion criteria
-        candidate_sources: list[SourceInfo] = []
-        excluded_count = 0
-
-        for source in unavailable:
-            url = source.get("url", "")
-
-            # Check if source should be excluded (based on config)
-            is_excluded = any(excl in url.lower() for excl in excluded_domains)
-            if is_excluded:
-                excluded_count += 1
-                debug_log(f"[NODE: load_unavailable_sources] Excluding: {url}")
-                continue
-
-            # Apply optional URL filter
-            if url_filter:
-                if not any(f.lower() in url.lower() for f in url_filter):
-                    continue
-
-            candidate_sources.append(SourceInfo(
-                url=url,
-                notes=source.get("notes"),
-            ))
-
-        debug_log(f"[NODE: load_unavailable_sources] Excluded {excluded_count} sources")
+        # Apply exclusion criteria (based on config): exact host or any
+        # subdomain of an excluded domain
+        excluded_urls = [
+            source.get("url", "") for source in unavailable
+            if _is_excluded(source.get("url", ""), excluded_domains, excluded_suffixes)
+        ]
+        excluded_set = set(excluded_urls)
+
+        # Apply optional URL filter
+        url_filter_lower = [f.lower() for f in url_filter] if url_filter else None
+        candidate_sources: list[SourceInfo] = [
+            SourceInfo(url=url, notes=source.get("notes"))
+            for source in unavailable
+            if (url := source.get("url", "")) not in excluded_set
+            and matches_filter(url, url_filter_lower)
+        ]
+
+        debug_log(f"[NODE: load_unavailable_sources] Excluded {len(excluded_urls)} sources")
+        if excluded_urls:
+            debug_log(f"[NODE: load_unavailable_sources] Excluding: {', '.join(excluded_urls)}")
         debug_log(f"[NODE: load_unavailable_sources] Candidate sources: {len(candidate_sources)}")
 
         # Apply incremental filtering (skip recently-checked URLs)
@@ -171,7 +191,7 @@ def load_unavailable_sources(state: dict) -> dict:
 
         debug_log(f"[NODE: load_unavailable_sources] Sources to test: {len(sources_to_test)}")
 
-        for source in sources_to_test:
-            debug_log(f"[NODE: load_unavailable_sources]   - {source['url']}")
+        if sources_to_test:
+            debug_log(f"[NODE: load_unavailable_sources] To test: {', '.join(s['url'] for s in sources_to_test)}")
 
         return {"sources_to_test": sources_to_test, "skipped_urls": skipped_urls}
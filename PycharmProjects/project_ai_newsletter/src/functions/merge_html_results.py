@@ -56,20 +56,21 @@ def merge_html_results(state: dict) -> dict:
         article_by_url = {a["url"]: a for a in article_analyses}
         classification_by_url = {c["url"]: c for c in source_classifications}
 
-        # Get all URLs from classifications (should have all)
-        all_urls = set(classification_by_url.keys())
-
-        final_results: list[HTMLAvailabilityResult] = []
         timestamp = datetime.now().isoformat()
 
-        for url in all_urls:
-            access = accessibility_by_url.get(url, {})
-            listing = listing_by_url.get(url, {})
-            article = article_by_url.get(url, {})
-            classification = classification_by_url.get(url, {})
-
-            result = _build_result(url, access, listing, article, classification, timestamp)
-            final_results.append(result)
+        # One result per classified URL (classifications cover all sources),
+        # in classification order
+        final_results: list[HTMLAvailabilityResult] = [
+            _build_result(
+                url,
+                accessibility_by_url.get(url, {}),
+                listing_by_url.get(url, {}),
+                article_by_url.get(url, {}),
+                classification,
+                timestamp,
+            )
+            for url, classification in classification_by_url.items()
+        ]
 
         debug_log(f"[NODE: merge_html_results] Created {len(final_results)} final results")
 
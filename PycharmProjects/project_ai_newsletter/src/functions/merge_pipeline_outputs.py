@@ -7,9 +7,15 @@ into a single list for deduplication.
 
 import json
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils.json_parse import read_json_file
+
+
+# Query parameters that only track the referrer (utm_* is matched by prefix)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref_src"})
 
 
 def _get_input_files() -> dict:
@@ -32,7 +38,8 @@ def merge_pipeline_outputs(state: dict) -> dict:
     Merge articles from RSS, HTML, Browser-Use, and Twitter pipelines.
 
     - Adds 'source_type' field to each article ("rss", "html", "browser_use", "twitter")
-    - Performs URL deduplication at merge point (priority: RSS > HTML > browser_use > Twitter)
+    - Performs URL deduplication at merge point on normalized URLs
+      (priority: RSS > HTML > browser_use > Twitter)
     - Handles missing/empty files gracefully
 
     Args:
@@ -75,7 +82,7 @@ def merge_pipeline_outputs(state: dict) -> dict:
             if not file_path:
                 continue
 
-            articles = _load_articles_from_file(file_path, source_type)
+            articles = _load_articles_from_file(file_path)
             stats["by_source_type"][source_type] = {
                 "loaded": len(articles),
                 "kept": 0,
@@ -84,9 +91,10 @@ def merge_pipeline_outputs(state: dict) -> dict:
 
             for article in articles:
                 url = article.get("url", "")
+                url_key = _url_dedup_key(url)
                 stats["total_before_dedup"] += 1
 
-                if url in seen_urls:
+                if url_key in seen_urls:
                     # URL collision - skip (lower priority source)
                     stats["url_collisions"] += 1
                     stats["by_source_type"][source_type]["url_collisions"] += 1
@@ -94,7 +102,9 @@ def merge_pipeline_outputs(state: dict) -> dict:
                         f"[NODE: merge_pipeline_outputs] URL collision (skipped): {url[:60]}..."
                     )
                 else:
-                    seen_urls.add(url)
+                    # Tag only articles that survive dedup
+                    seen_urls.add(url_key)
+                    article["source_type"] = source_type
                     all_articles.append(article)
                     stats["by_source_type"][source_type]["kept"] += 1
 
@@ -118,16 +128,47 @@ def merge_pipeline_outputs(state: dict) -> dict:
         }
 
 
-def _load_articles_from_file(file_path: Path, source_type: str) -> list[dict]:
+def _url_dedup_key(url: str) -> str:
     """
-    Load articles from a JSON file and add source_type field.
+    Normalize a URL for merge-time dedup (the article keeps its original URL).
+
+    Lowercases scheme and host, drops the fragment, tracking query
+    parameters (utm_*, fbclid, ...) and a trailing slash, so the same
+    article shared with different tracking links collides. URLs that
+    urlsplit can't parse are used as-is.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Dedup key
+    """
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(url)
+        query = urlencode([
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+        ])
+    except ValueError:
+        # Malformed URL (e.g. "Invalid IPv6 URL") - dedup on the raw string
+        return url
+
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def _load_articles_from_file(file_path: Path) -> list[dict]:
+    """
+    Load articles from a pipeline output JSON file.
 
     Args:
         file_path: Path to the JSON file.
-        source_type: Source type to add ("rss", "html", "twitter").
 
     Returns:
-        List of articles with source_type field added.
+        List of articles (source_type is added by the caller when kept).
     """
     if not file_path.exists():
         debug_log(
@@ -136,8 +177,7 @@ def _load_articles_from_file(file_path: Path, source_type: str) -> list[dict]:
         return []
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(file_path)
     except (json.JSONDecodeError, IOError) as e:
         debug_log(
             f"[NODE: merge_pipeline_outputs] Error reading {file_path.name}: {e}",
@@ -153,10 +193,6 @@ def _load_articles_from_file(file_path: Path, source_type: str) -> list[dict]:
         )
         return []
 
-    # Add source_type to each article
-    for article in articles:
-        article["source_type"] = source_type
-
     debug_log(
         f"[NODE: merge_pipeline_outputs] Loaded {len(articles)} articles from {file_path.name}"
     )
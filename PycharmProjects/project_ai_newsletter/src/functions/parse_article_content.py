@@ -4,13 +4,74 @@ Parse Article Content Node
 Extracts article content from HTML using CSS selectors discovered in HTML Layer 1.
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import TypedDict, Optional
 
 from bs4 import BeautifulSoup
 
-from src.tracking import debug_log, track_time
+from src.tracking import debug_log, init_worker_logging, track_time
+
+
+# Process pool for HTML parsing (small batches parse faster in-process)
+PARALLEL_PARSE_MIN_ARTICLES = 20
+MAX_PARSE_WORKERS = 8
+
+# Pages shorter than this are error/empty pages, not articles
+MIN_ARTICLE_HTML_LENGTH = 500
+
+# First class/id in a simple selector ("div.post-body" -> "post-body"), or its tag name
+_SELECTOR_CLASS_ID_RE = re.compile(r"[.#]([-\w]+)")
+_SELECTOR_TAG_RE = re.compile(r"^([a-zA-Z][\w-]*)")
+
+
+# =============================================================================
+# Date Formats
+# =============================================================================
+
+# strptime formats for each L1 date_format hint (checked by substring)
+_HINT_FORMATS = (
+    ("MMMM D, YYYY", ("%B %d, %Y",)),  # %d also accepts "January 5, 2026"
+    ("YYYY.MM.DD", ("%Y.%m.%d %H:%M:%S", "%Y.%m.%d")),
+    ("YYYY-MM-DD", ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d")),
+)
+
+# Common fallback formats, tried after the hinted ones
+_FALLBACK_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%Y.%m.%d",
+)
+
+# Regex for each strptime directive used above (strptime accepts 1-digit
+# month/day/time fields and matches format whitespace as \s+)
+_DIRECTIVE_RES = {
+    "%Y": r"\d{4}",
+    "%m": r"\d{1,2}",
+    "%d": r" ?\d{1,2}",  # strptime also accepts a space-padded day (" 5")
+    "%H": r"\d{1,2}",
+    "%M": r"\d{1,2}",
+    "%S": r"\d{1,2}",
+    "%B": r"[a-z]+",
+    "%b": r"[a-z]+",
+}
+_DIRECTIVE_SPLIT_RE = re.compile(r"(%[A-Za-z])")
+
+# Dates embedded in longer strings
+_EMBEDDED_DATE_RES = (
+    re.compile(r"(\d{4}-\d{2}-\d{2})"),  # YYYY-MM-DD
+    re.compile(r"(\d{4}/\d{2}/\d{2})"),  # YYYY/MM/DD
+    re.compile(r"(\d{4}\.\d{2}\.\d{2})"),  # YYYY.MM.DD
+)
 
 
 class ParsedArticle(TypedDict):
@@ -41,21 +102,29 @@ def parse_article_content(state: dict) -> dict:
         fetched_articles = state.get("fetched_articles", [])
         debug_log(f"[NODE: parse_article_content] Parsing {len(fetched_articles)} articles")
 
-        parsed_articles: list[ParsedArticle] = []
-        success_count = 0
-        skip_count = 0
-
-        for article in fetched_articles:
-            if not article.get("html"):
-                skip_count += 1
-                continue
-
-            parsed = _parse_article(article)
-            parsed_articles.append(parsed)
-
-            # Count success (has title and content)
-            if parsed["title"] and parsed["content"]:
-                success_count += 1
+        # Only ship articles with HTML to the parser
+        work = [article for article in fetched_articles if article.get("html")]
+        skip_count = len(fetched_articles) - len(work)
+
+        # Parsing is CPU-bound (pure-Python HTML parser) - spread it across
+        # processes once the batch is big enough to pay for worker startup
+        if len(work) >= PARALLEL_PARSE_MIN_ARTICLES:
+            workers = min(os.cpu_count() or 1, MAX_PARSE_WORKERS)
+            chunksize = max(1, len(work) // (4 * workers))
+            debug_log(f"[NODE: parse_article_content] Parsing in {workers} processes (chunksize={chunksize})")
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_logging) as executor:
+                parsed_articles: list[ParsedArticle] = list(executor.map(_parse_article, work, chunksize=chunksize))
+        else:
+            parsed_articles = [_parse_article(article) for article in work]
+
+        # Count success (has title and content)
+        success_count = sum(1 for parsed in parsed_articles if parsed["title"] and parsed["content"])
+        precheck_count = sum(1 for parsed in parsed_articles if "precheck_failed" in parsed["parse_errors"])
+        if precheck_count:
+            debug_log(
+                f"[NODE: parse_article_content] Precheck rejected {precheck_count} articles "
+                f"(page too small or content selector absent)"
+            )
 
         debug_log(f"[NODE: parse_article_content] Parsed {success_count}/{len(parsed_articles)} articles successfully")
         debug_log(f"[NODE: parse_article_content] Skipped {skip_count} articles (no HTML)")
@@ -78,6 +147,19 @@ def _parse_article(article: dict) -> ParsedArticle:
     source_name = article["source_name"]
     errors: list[str] = []
 
+    # Skip the DOM build for error/block pages that can't hold the content
+    if not _passes_precheck(html, article.get("content_selector", "")):
+        return ParsedArticle(
+            url=url,
+            source_name=source_name,
+            source_url=article["source_url"],
+            title=None,
+            content=None,
+            date=None,
+            author=None,
+            parse_errors=["precheck_failed"],
+        )
+
     soup = BeautifulSoup(html, "html.parser")
 
     # Extract title
@@ -118,6 +200,45 @@ def _parse_article(article: dict) -> ParsedArticle:
     )
 
 
+def _passes_precheck(html: str, content_selector: str) -> bool:
+    """
+    Cheap check that a page could contain the article before parsing it.
+
+    Rejects tiny pages and pages where the content selector's leading
+    class/id/tag never appears in the raw HTML. Selector lists, escaped
+    selectors and attribute/pseudo-class parts aren't checked (no single
+    required token can be derived).
+
+    Args:
+        html: Raw page HTML
+        content_selector: CSS selector for content
+
+    Returns:
+        False if the page can't contain the content element
+    """
+    if len(html) < MIN_ARTICLE_HTML_LENGTH:
+        return False
+
+    if not content_selector or "," in content_selector or "\\" in content_selector:
+        return True
+
+    first = content_selector.split()[0]
+    if any(c in first for c in "[:("):
+        # Attribute/pseudo-class parts (e.g. :not(.ad)) don't imply a required token
+        return True
+
+    match = _SELECTOR_CLASS_ID_RE.search(first)
+    if match:
+        token = match.group(1).lower()
+    else:
+        match = _SELECTOR_TAG_RE.match(first)
+        if not match:
+            return True
+        token = "<" + match.group(1).lower()
+
+    return token in html.lower()
+
+
 def _extract_title(soup: BeautifulSoup, selector: str) -> Optional[str]:
     """
     Extract title using CSS selector.
@@ -141,9 +262,8 @@ def _extract_title(soup: BeautifulSoup, selector: str) -> Optional[str]:
             return _clean_text(elem.get("content", ""))
         return None
 
-    # Try multiple selectors (comma-separated)
-    selectors = [s.strip() for s in selector.split(",")]
-    for sel in selectors:
+    # Try multiple selectors (comma-separated), in order
+    for sel in _split_selector(selector):
         elem = soup.select_one(sel)
         if elem:
             return _clean_text(elem.get_text())
@@ -151,6 +271,24 @@ def _extract_title(soup: BeautifulSoup, selector: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=128)
+def _split_selector(selector: str) -> tuple[str, ...]:
+    """
+    Split a comma-separated selector list into individual selectors.
+
+    Selectors come from the per-source L1 config, so every article of a
+    source reuses the same split (soupsieve already caches the compiled
+    selectors themselves).
+
+    Args:
+        selector: Comma-separated CSS selectors
+
+    Returns:
+        Stripped selectors, in priority order
+    """
+    return tuple(s.strip() for s in selector.split(","))
+
+
 def _extract_content(soup: BeautifulSoup, selector: str) -> Optional[str]:
     """
     Extract article content using CSS selector.
@@ -231,62 +369,31 @@ def _parse_date_string(date_str: str, date_format: Optional[str]) -> Optional[st
             # Remove timezone for parsing
             clean = date_str.split("+")[0].split("Z")[0]
             dt = datetime.fromisoformat(clean[:19])
-            return dt.strftime("%Y-%m-%d")
+            return dt.date().isoformat()
     except ValueError:
         pass
 
-    # Try common formats based on date_format hint
-    formats_to_try = []
-
-    if date_format:
-        # Convert hint to Python strptime format
-        if "MMMM D, YYYY" in date_format:
-            formats_to_try.append("%B %d, %Y")
-            formats_to_try.append("%B %-d, %Y")  # Without leading zero
-        if "YYYY.MM.DD" in date_format:
-            formats_to_try.append("%Y.%m.%d %H:%M:%S")
-            formats_to_try.append("%Y.%m.%d")
-        if "YYYY-MM-DD" in date_format:
-            formats_to_try.append("%Y-%m-%d %H:%M:%S")
-            formats_to_try.append("%Y-%m-%d")
-
-    # Add common fallback formats
-    formats_to_try.extend([
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-        "%Y.%m.%d",
-    ])
-
-    for fmt in formats_to_try:
+    # Try common formats based on date_format hint - only call strptime for
+    # formats whose shape matches, instead of raising through every format
+    for fmt, shape in _formats_for_hint(date_format):
+        if not shape.fullmatch(date_str):
+            continue
         try:
-            # Handle "January 5, 2026" style (may need to extract just the date part)
-            dt = datetime.strptime(date_str[:len(date_str)], fmt)
-            return dt.strftime("%Y-%m-%d")
+            return datetime.strptime(date_str, fmt).date().isoformat()
         except ValueError:
+            # Right shape but not a valid date (e.g. month 13, %B vs %b)
             continue
 
     # Try regex extraction for embedded dates
-    date_patterns = [
-        r"(\d{4}-\d{2}-\d{2})",  # YYYY-MM-DD
-        r"(\d{4}/\d{2}/\d{2})",  # YYYY/MM/DD
-        r"(\d{4}\.\d{2}\.\d{2})",  # YYYY.MM.DD
-    ]
-
-    for pattern in date_patterns:
-        match = re.search(pattern, date_str)
+    for pattern in _EMBEDDED_DATE_RES:
+        match = pattern.search(date_str)
         if match:
             extracted = match.group(1)
             # Normalize separators
             normalized = extracted.replace("/", "-").replace(".", "-")
             try:
                 dt = datetime.strptime(normalized, "%Y-%m-%d")
-                return dt.strftime("%Y-%m-%d")
+                return dt.date().isoformat()
             except ValueError:
                 continue
 
@@ -294,6 +401,45 @@ def _parse_date_string(date_str: str, date_format: Optional[str]) -> Optional[st
     return None
 
 
+@lru_cache(maxsize=32)
+def _formats_for_hint(date_format: Optional[str]) -> tuple[tuple[str, re.Pattern], ...]:
+    """
+    Get the strptime formats to try for a date_format hint.
+
+    Args:
+        date_format: Hint about format (e.g., "MMMM D, YYYY"), one per source
+
+    Returns:
+        (format, shape regex) pairs: hinted formats followed by the common fallbacks
+    """
+    formats: tuple[str, ...] = ()
+    if date_format:
+        for hint, hint_formats in _HINT_FORMATS:
+            if hint in date_format:
+                formats += hint_formats
+    return tuple((fmt, _format_shape(fmt)) for fmt in formats + _FALLBACK_FORMATS)
+
+
+@lru_cache(maxsize=32)
+def _format_shape(fmt: str) -> re.Pattern:
+    """
+    Compile a regex matching the strings strptime could accept for a format.
+
+    Args:
+        fmt: strptime format using the directives in _DIRECTIVE_RES
+
+    Returns:
+        Case-insensitive pattern, used with fullmatch
+    """
+    parts = []
+    for token in _DIRECTIVE_SPLIT_RE.split(fmt):
+        if token in _DIRECTIVE_RES:
+            parts.append(_DIRECTIVE_RES[token])
+        else:
+            parts.append(r"\s+".join(map(re.escape, token.split(" "))))
+    return re.compile("".join(parts), re.IGNORECASE)
+
+
 def _extract_author(soup: BeautifulSoup, selector: str) -> Optional[str]:
     """
     Extract author using CSS selector.
@@ -335,10 +481,5 @@ def _clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize whitespace
-    text = re.sub(r"\s+", " ", text)
-
-    # Remove common artifacts
-    text = text.strip()
-
-    return text
+    # Normalize whitespace (split() drops leading/trailing runs too)
+    return " ".join(text.split())
@@ -5,13 +5,15 @@ Saves the final output to JSON and CSV files.
 """
 
 import csv
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from src.config import get_data_dir
 from src.database import ArticleDatabase
 from src.tracking import debug_log, track_time, cost_tracker
+from src.utils.json_parse import write_json_file
 
 
 def save_aggregated_content(state: dict) -> dict:
@@ -48,23 +50,10 @@ def save_aggregated_content(state: dict) -> dict:
             "cost": _get_cost_info(),
         }
 
-        # Count by category
-        category_counts: dict[str, int] = {}
-        region_counts: dict[str, int] = {}
-        layer_counts: dict[str, int] = {}
-
-        for record in output_data:
-            cat = record.get("category", "Other")
-            reg = record.get("region", "Unknown")
-            lay = record.get("layer", "B2B Applications")
-
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-            region_counts[reg] = region_counts.get(reg, 0) + 1
-            layer_counts[lay] = layer_counts.get(lay, 0) + 1
-
-        metadata["by_category"] = category_counts
-        metadata["by_region"] = region_counts
-        metadata["by_layer"] = layer_counts
+        # Count by category, region and layer
+        metadata["by_category"] = Counter(record.get("category", "Other") for record in output_data)
+        metadata["by_region"] = Counter(record.get("region", "Unknown") for record in output_data)
+        metadata["by_layer"] = Counter(record.get("layer", "B2B Applications") for record in output_data)
 
         # Save JSON
         json_output = {
@@ -72,37 +61,34 @@ def save_aggregated_content(state: dict) -> dict:
             "articles": output_data,
         }
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(json_output, f, indent=2, ensure_ascii=False)
-
-        debug_log(f"[NODE: save_aggregated_content] Saved JSON to {json_path}")
-
-        # Save CSV
-        if output_data:
-            fieldnames = ["date", "source", "region", "category", "layer", "title", "contents", "url"]
-
-            with open(csv_path, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(output_data)
-
-            debug_log(f"[NODE: save_aggregated_content] Saved CSV to {csv_path}")
-
-        # Save discarded articles CSV
         discarded_csv_path = data_dir / "discarded_news.csv"
-        if discarded_articles:
-            discarded_fieldnames = ["source_name", "title", "url", "pub_date", "discard_reason"]
-
-            with open(discarded_csv_path, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=discarded_fieldnames, extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(discarded_articles)
-
-            debug_log(f"[NODE: save_aggregated_content] Saved {len(discarded_articles)} discarded articles to {discarded_csv_path}")
-
-            # Also store discarded articles in database for debugging/reference
-            db = ArticleDatabase()
-            db.insert_discarded_batch(discarded_articles, source_type="rss")
+        fieldnames = ["date", "source", "region", "category", "layer", "title", "contents", "url"]
+        discarded_fieldnames = ["source_name", "title", "url", "pub_date", "discard_reason"]
+
+        # The sinks are independent files (plus the DB) - write them
+        # concurrently; file writes and sqlite release the GIL
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sinks = {executor.submit(write_json_file, json_path, json_output): f"JSON to {json_path}"}
+
+            # Save CSV
+            if output_data:
+                sinks[executor.submit(_write_csv, csv_path, output_data, fieldnames)] = f"CSV to {csv_path}"
+
+            # Save discarded articles CSV
+            if discarded_articles:
+                sinks[executor.submit(_write_csv, discarded_csv_path, discarded_articles, discarded_fieldnames)] = (
+                    f"{len(discarded_articles)} discarded articles to {discarded_csv_path}"
+                )
+
+                # Also store discarded articles in database for debugging/reference
+                db = ArticleDatabase()
+                sinks[executor.submit(db.insert_discarded_batch, discarded_articles, source_type="rss")] = (
+                    f"{len(discarded_articles)} discarded articles to database"
+                )
+
+            for future, description in sinks.items():
+                future.result()
+                debug_log(f"[NODE: save_aggregated_content] Saved {description}")
 
         # Print summary
         _print_summary(metadata, output_data, len(discarded_articles))
@@ -118,6 +104,25 @@ def save_aggregated_content(state: dict) -> dict:
         }
 
 
+def _write_csv(path: Path, records: list[dict], fieldnames: list[str]) -> None:
+    """
+    Write records to CSV with a header row.
+
+    Rows are flattened to field lists up front and written with csv.writer
+    (same output as DictWriter with extrasaction="ignore", minus its
+    per-row dict handling).
+
+    Args:
+        path: Destination CSV path
+        records: Dicts to write; missing fields are written empty
+        fieldnames: Columns, in order
+    """
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([record.get(field, "") for field in fieldnames] for record in records)
+
+
 def _get_cost_info() -> dict:
     """Get cost tracking info."""
     try:
@@ -142,20 +147,11 @@ def _print_summary(metadata: dict, output_data: list, discarded_count: int = 0)
     print(f"Sufficiency score: {metadata.get('sufficiency_score', 'N/A')}")
     print()
 
-    print("By Category:")
-    for cat, count in sorted(metadata.get("by_category", {}).items(), key=lambda x: -x[1]):
-        print(f"  {cat}: {count}")
-    print()
-
-    print("By Region:")
-    for reg, count in sorted(metadata.get("by_region", {}).items(), key=lambda x: -x[1]):
-        print(f"  {reg}: {count}")
-    print()
-
-    print("By Layer:")
-    for lay, count in sorted(metadata.get("by_layer", {}).items(), key=lambda x: -x[1]):
-        print(f"  {lay}: {count}")
-    print()
+    for heading, key in (("By Category:", "by_category"), ("By Region:", "by_region"), ("By Layer:", "by_layer")):
+        print(heading)
+        for name, count in metadata[key].most_common():
+            print(f"  {name}: {count}")
+        print()
 
     cost_info = metadata.get("cost", {})
     print(f"LLM Cost: {cost_info.get('total_cost', 'unknown')}")
@@ -4,12 +4,12 @@ Save HTML Availability Node
 Saves HTML availability results to JSON file, merging with existing results.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
 from src.config import get_data_dir
 from src.tracking import debug_log, track_time
+from src.utils.json_parse import read_json_file, write_json_file
 
 
 def _get_output_file() -> Path:
@@ -42,9 +42,8 @@ def save_html_availability(state: dict) -> dict:
         existing_results = []
         if output_file.exists():
             try:
-                with open(output_file) as f:
-                    existing_data = json.load(f)
-                    existing_results = existing_data.get("results", [])
+                existing_data = read_json_file(output_file)
+                existing_results = existing_data.get("results", [])
                 debug_log(f"[NODE: save_html_availability] Loaded {len(existing_results)} existing results")
             except Exception as e:
                 debug_log(f"[NODE: save_html_availability] Error loading existing file: {e}", "warning")
@@ -81,8 +80,7 @@ def save_html_availability(state: dict) -> dict:
         }
 
         # Write to file (get_data_dir already creates the directory)
-        with open(output_file, "w") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_json_file(output_file, output_data)
 
         debug_log(f"[NODE: save_html_availability] Saved to {output_file}")
         debug_log(f"[NODE: save_html_availability] Summary:")
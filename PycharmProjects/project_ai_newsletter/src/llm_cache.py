@@ -0,0 +1,158 @@
+"""
+Persistent LLM Response Cache
+
+SQLite-backed exact-match cache for deterministic LLM calls. Re-runs and
+overlapping daily feeds send the same article content again; a cache hit
+skips the API call entirely.
+
+Keys are content hashes built by the caller and should include the model and
+the system prompt, so switching either one invalidates old entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.config import get_data_dir
+from src.tracking import debug_log
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+# SQLite caps bound parameters per statement; stay well below it
+MAX_KEYS_PER_QUERY = 500
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache(created_at);
+"""
+
+
+def get_cache_path() -> Path:
+    """Get LLM cache path for current config."""
+    return get_data_dir() / "llm_cache.db"
+
+
+# =============================================================================
+# Cache Helper Class
+# =============================================================================
+
+class LLMCache:
+    """
+    SQLite cache of LLM results, keyed by content hash.
+
+    Values are stored as JSON. Entries older than the TTL are treated as
+    misses and purged when the cache is opened.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: int = DEFAULT_TTL_SECONDS, db_path: Path = None):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Caller name (e.g. 'generate_summaries'); TTL purges are per namespace
+            ttl_seconds: Max age of a usable entry
+            db_path: Path to the SQLite file. If None, uses get_cache_path().
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path if db_path is not None else get_cache_path()
+        self._init_db()
+
+    @contextmanager
+    def _connection(self):
+        """Context manager for database connections."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """Create the table and drop this namespace's expired entries."""
+        with self._connection() as conn:
+            conn.executescript(SCHEMA_SQL)
+            conn.execute(
+                "DELETE FROM llm_cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            )
+            conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the given parts.
+
+        Args:
+            *parts: Strings that fully determine the LLM result
+
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")  # Separator so ("ab", "c") != ("a", "bc")
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, object]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict mapping each hit key to its cached value (misses are absent)
+        """
+        hits: dict[str, object] = {}
+        min_created_at = time.time() - self.ttl_seconds
+
+        with self._connection() as conn:
+            for i in range(0, len(keys), MAX_KEYS_PER_QUERY):
+                chunk = keys[i:i + MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT key, value FROM llm_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, min_created_at),
+                )
+                for key, value in cursor.fetchall():
+                    hits[key] = json.loads(value)
+
+        return hits
+
+    def set_many(self, items: dict[str, object]) -> None:
+        """
+        Store several values at once, replacing existing entries.
+
+        Args:
+            items: Dict mapping cache key to a JSON-serializable value
+        """
+        if not items:
+            return
+
+        now = time.time()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO llm_cache (key, namespace, value, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (key, self.namespace, json.dumps(value, ensure_ascii=False), now)
+                    for key, value in items.items()
+                ],
+            )
+            conn.commit()
+
+        debug_log(f"[LLM CACHE] Stored {len(items)} {self.namespace} entries")
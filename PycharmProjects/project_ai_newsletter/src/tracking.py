@@ -15,12 +15,13 @@ from pathlib import Path
 # Debug Logging Setup
 # =============================================================================
 
-def setup_debug_logging(log_file: str = "debug.log") -> logging.Logger:
+def setup_debug_logging(log_file: str = "debug.log", mode: str = "w") -> logging.Logger:
     """
     Set up debug logging to both file and console.
 
     Args:
         log_file: Path to the log file (default: debug.log in project root)
+        mode: File mode - "w" starts a fresh log, "a" appends (worker processes)
 
     Returns:
         Configured logger instance.
@@ -40,7 +41,7 @@ def setup_debug_logging(log_file: str = "debug.log") -> logging.Logger:
 
     # File handler - captures everything
     log_path = Path(log_file)
-    file_handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
+    file_handler = logging.FileHandler(log_path, mode=mode, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
     logger.addHandler(file_handler)
@@ -68,6 +69,16 @@ def get_logger() -> logging.Logger:
     return _logger
 
 
+def init_worker_logging() -> None:
+    """
+    Set up logging in a worker process (ProcessPoolExecutor initializer).
+
+    Appends to the parent's debug.log instead of truncating it.
+    """
+    global _logger
+    _logger = setup_debug_logging(mode="a")
+
+
 def debug_log(message: str, level: str = "info"):
     """
     Log a debug message to both file and console.
@@ -2,9 +2,15 @@
 Utility functions for the project.
 """
 
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
 
-from src.config import get_prompts_dir
+from src.config import get_config, get_prompts_dir
+
+
+T = TypeVar("T")
 
 
 # =============================================================================
@@ -12,7 +18,7 @@ from src.config import get_prompts_dir
 # =============================================================================
 
 # Legacy prompts directory (for non-config-specific prompts like Layer 1/3)
-LEGACY_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+LEGACY_PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
 
 
 def load_prompt(filename: str) -> str:
@@ -31,6 +37,13 @@ def load_prompt(filename: str) -> str:
     Raises:
         FileNotFoundError: If the prompt file doesn't exist in either location.
     """
+    # Cached per (config, filename) - batch loops call this once per LLM call
+    return _load_prompt_cached(get_config(), filename)
+
+
+@lru_cache(maxsize=64)
+def _load_prompt_cached(config_name: str, filename: str) -> str:
+    """Read a prompt from disk (cache key includes the active config)."""
     # First, try config-specific prompts directory
     config_prompt_path = get_prompts_dir() / filename
     if config_prompt_path.exists():
@@ -69,3 +82,47 @@ def load_prompt_with_vars(filename: str, **variables) -> str:
     """
     prompt = load_prompt(filename)
     return prompt.format(**variables)
+
+
+# =============================================================================
+# Iteration
+# =============================================================================
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Yield successive lists of up to `size` items.
+
+    Equivalent to itertools.batched (Python 3.12+), which isn't available
+    on every interpreter this project runs on.
+
+    Args:
+        items: Any iterable.
+        size: Maximum batch size.
+
+    Yields:
+        Lists of at most `size` items, in input order.
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# =============================================================================
+# Filtering
+# =============================================================================
+
+def matches_filter(value: str, filter_lower: list[str] | None) -> bool:
+    """
+    Check a value against an optional CLI filter (case-insensitive substring).
+
+    Args:
+        value: Handle, URL, etc. to check.
+        filter_lower: Lowercased filter terms, or None for no filter.
+
+    Returns:
+        True if there is no filter or any term occurs in the value.
+    """
+    if not filter_lower:
+        return True
+    value_lower = value.lower()
+    return any(f in value_lower for f in filter_lower)
@@ -0,0 +1,110 @@
+"""
+JSON parsing helpers for LLM and agent responses, and JSON data files.
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+
+try:
+    import orjson  # Optional - several times faster than json for large data files
+except ImportError:
+    orjson = None
+
+
+# Matches a whole response wrapped in a markdown code block (```json ... ```)
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n(.*?)\n```\s*$", re.DOTALL)
+
+# Data files at least this big are memory-mapped rather than read into a bytes copy
+MMAP_MIN_BYTES = 1 << 20  # 1 MB
+
+
+def strip_fences(text: str) -> str:
+    """
+    Strip a surrounding markdown code block from a response, if present.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Response text without the ``` fences.
+    """
+    text = text.strip()
+
+    # Fast path: most responses are bare JSON
+    if not text.startswith("```"):
+        return text
+
+    match = _FENCE_RE.match(text)
+    if match:
+        return match.group(1)
+
+    # Unterminated or unusual fence - drop the opening line only
+    return text.partition("\n")[2].removesuffix("```").strip()
+
+
+def parse_json_response(response_text: str) -> dict:
+    """
+    Parse a JSON LLM response, handling markdown code blocks.
+
+    Args:
+        response_text: Raw LLM response
+
+    Returns:
+        Parsed JSON dict
+    """
+    return json.loads(strip_fences(response_text))
+
+
+def read_json_file(path: Path):
+    """
+    Read and parse a JSON data file.
+
+    Uses orjson when installed (its JSONDecodeError subclasses
+    json.JSONDecodeError, so callers catch the same exception either way).
+    With orjson, large files (e.g. the raw tweet cache) are parsed straight
+    from a read-only memory map instead of a full in-heap copy.
+
+    Args:
+        path: Path to a UTF-8 JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is None:
+        return json.loads(Path(path).read_bytes())
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def write_json_file(path: Path, data) -> None:
+    """
+    Write a JSON data file (2-space indent, UTF-8, non-ASCII kept as-is).
+
+    Uses orjson when installed; the output matches json.dump(data, f,
+    indent=2, ensure_ascii=False) for the plain dict/list/str/number data
+    the pipeline saves. The data is written to a sibling .tmp file and
+    swapped in with os.replace, so a crash mid-write never leaves a
+    truncated file behind.
+
+    Args:
+        path: Destination path
+        data: JSON-serializable data
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    if orjson is None:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    else:
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+    os.replace(tmp_path, path)
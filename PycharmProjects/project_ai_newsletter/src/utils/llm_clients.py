@@ -0,0 +1,32 @@
+"""
+Shared LLM API clients.
+
+Each client is created once per process so every node reuses the same
+connection pool.
+"""
+
+import os
+from functools import lru_cache
+
+import anthropic
+import openai
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> anthropic.Anthropic:
+    """Get the shared sync Anthropic client."""
+    return anthropic.Anthropic()
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> openai.OpenAI:
+    """
+    Get the shared sync OpenAI client.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+    return openai.OpenAI(api_key=api_key)
@@ -0,0 +1,35 @@
+"""
+Source name helpers for turning source URLs into display names.
+"""
+
+import re
+from functools import lru_cache
+
+
+# Protocol and www. prefixes stripped before taking the host
+_PREFIX_RE = re.compile(r"https?://|www\.")
+
+
+@lru_cache(maxsize=1024)
+def extract_source_name(url: str) -> str:
+    """
+    Extract a readable source name from URL.
+
+    Memoized - the same source URLs come back on every run.
+
+    Args:
+        url: Full URL of the source
+
+    Returns:
+        Human-readable source name (e.g. https://www.tech-crunch.com/ai -> "Tech Crunch")
+    """
+    # Remove protocol and www., then trailing slash and path
+    name = _PREFIX_RE.sub("", url).split("/", 1)[0]
+
+    # Remove .com, .ai, etc. for cleaner name
+    first, dot, _ = name.partition(".")
+    if dot:
+        # Use first part as name, capitalize
+        name = first.replace("-", " ").replace("_", " ").title()
+
+    return name